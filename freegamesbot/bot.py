@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+import json
+import time
 import asyncio
+import hashlib
 import logging
 import datetime as dt
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import discord
 from discord.ext import tasks
 
 from .config import settings
-from .embeds import giveaway_embed, GiveawayView
-from .db import SettingsRepository
-from .gamerpower import GamerPowerClient, Giveaway
+from .embeds import PackedGiveawayView, RenderCache, digest_messages
+from .db import GuildSettings, SettingsRepository
+from .catalog import GiveawayCatalog
+from .diff import diff_snapshots, snapshot_digest
+from .fanout import FanoutReport, fan_out
+from .sender import SendScheduler
+from .channels import ChannelResolver, TextTarget
+from .rss import RssIngestor, merge_giveaways, rss_only
+from .filters import FilterIndex
+from .digest import DigestSchedule
+from .schedule import AdaptivePollSchedule, PollOutcome
+from .gamerpower import CircuitOpenError, GamerPowerClient, Giveaway
 
 log = logging.getLogger(__name__)
 
@@ -20,11 +32,65 @@ try:
 except RuntimeError:
     asyncio.set_event_loop(asyncio.new_event_loop())
 
-intents = discord.Intents.default()
-bot = discord.Bot(intents=intents)
+boot_started = time.perf_counter()
+startup_timeline: Dict[str, float] = {}
 
-api_client = GamerPowerClient(settings.gamerpower_base_url)
-repo = SettingsRepository(settings.db_path)
+intents = discord.Intents.default()
+bot = discord.Bot(intents=intents, auto_sync_commands=False)
+
+api_client = GamerPowerClient(
+    settings.gamerpower_base_url,
+    cache_ttl_seconds=settings.api_cache_ttl_seconds,
+    cache_max_entries=settings.api_cache_max_entries,
+    timeout_seconds=settings.api_timeout_seconds,
+    max_retries=settings.api_max_retries,
+    breaker_threshold=settings.api_breaker_threshold,
+    breaker_reset_seconds=settings.api_breaker_reset_seconds,
+)
+rss = RssIngestor(
+    settings.rss_feeds,
+    timeout_seconds=settings.rss_timeout_seconds,
+    concurrency=settings.rss_concurrency,
+)
+repo = SettingsRepository(
+    settings.db_path,
+    group_commit_seconds=settings.db_group_commit_seconds,
+    group_commit_max_writes=settings.db_group_commit_max_writes,
+    read_connections=settings.db_read_connections,
+    pragmas={
+        "synchronous": settings.db_synchronous,
+        "mmap_size": settings.db_mmap_size,
+        "cache_size": settings.db_cache_size,
+        "temp_store": settings.db_temp_store,
+    },
+)
+catalog = GiveawayCatalog()
+provisional: Dict[int, Giveaway] = {}
+confirmed: Dict[int, Tuple[Giveaway, Giveaway]] = {}
+filters = FilterIndex()
+route_index = FilterIndex()
+route_owners: Dict[int, int] = {}
+routes_version = -1
+digests = DigestSchedule()
+digest_task: Optional["asyncio.Task[None]"] = None
+renders = RenderCache()
+channels = ChannelResolver(
+    bot,
+    retry_base_seconds=settings.channel_retry_base_seconds,
+    retry_max_seconds=settings.channel_retry_max_seconds,
+)
+sender = SendScheduler(
+    global_rate=settings.send_global_rate,
+    channel_rate=settings.send_channel_rate,
+    channel_per_seconds=settings.send_channel_per_seconds,
+)
+
+poll_schedule = AdaptivePollSchedule(
+    settings.poll_interval_seconds,
+    settings.poll_min_interval_seconds,
+    settings.poll_max_interval_seconds,
+    jitter=settings.poll_jitter,
+)
 
 COGS = [
     "freegamesbot.cogs.freegames",
@@ -34,26 +100,122 @@ COGS = [
 cogs_loaded = False
 repo_connected = False
 startup_notified = False
-skip_initial_notify = False
 start_time: dt.datetime | None = None
 
 
+prepare_lock = asyncio.Lock()
+
+
+async def _prepare() -> None:
+    global repo_connected
+
+    async with prepare_lock:
+        if repo_connected:
+            return
+
+        phase_started = time.perf_counter()
+        await repo.connect()
+        startup_timeline["DB Connect"] = time.perf_counter() - phase_started
+
+        resumed = await repo.reset_claimed_outbox()
+        if resumed:
+            log.info("Resuming %s Interrupted Outbox Deliveries", resumed)
+        bot.repo = repo
+        bot.api_client = api_client
+        bot.rss = rss
+        bot.catalog = catalog
+        bot.filters = filters
+        bot.sender = sender
+        bot.channels = channels
+        bot.digests = digests
+        bot.fetch_latest_giveaways = _fetch_latest_giveaways
+        repo_connected = True
+
+        for guild_id, guild_filter in (await repo.get_guild_filters()).items():
+            filters.update(guild_id, guild_filter)
+
+        for guild_id, seconds, next_at in await repo.get_digest_schedule():
+            digests.schedule(guild_id, next_at or time.time() + seconds)
+
+        await _load_catalog_snapshot()
+
+        stored = await repo.get_bot_state("provisional_giveaways")
+        for giveaway_id in json.loads(stored or "[]"):
+            giveaway = catalog.get(giveaway_id)
+            if giveaway is not None:
+                provisional[giveaway_id] = giveaway
+
+
+async def _load_catalog_snapshot() -> None:
+    try:
+        snapshot = await repo.load_catalog_snapshot()
+        if snapshot is None:
+            return
+
+        payload, fetched_at = snapshot
+        giveaways = GiveawayCatalog.loads(payload)
+    except Exception:
+        log.exception("Failed To Load Catalog Snapshot")
+        return
+
+    catalog.replace(giveaways, age_seconds=max(0.0, time.time() - fetched_at))
+    log.info("Warm Started Catalog With %s Giveaways", len(catalog))
+
+
+def _canonical_schema(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: (
+                sorted(item, key=str)
+                if key in ("contexts", "integration_types") and item
+                else _canonical_schema(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical_schema(item) for item in value]
+    return value
+
+
+def _command_schema_hash() -> str:
+    schema = sorted(
+        (_canonical_schema(cmd.to_dict()) for cmd in bot.pending_application_commands),
+        key=lambda item: item["name"],
+    )
+    payload = json.dumps(schema, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def _sync_commands_if_changed() -> None:
+    schema_hash = _command_schema_hash()
+
+    if schema_hash == await repo.get_bot_state("command_schema_hash"):
+        await bot.sync_commands()
+        log.info("Command Schema Unchanged; Skipped Forced Sync")
+        return
+
+    await bot.sync_commands(force=True)
+    await repo.set_bot_state("command_schema_hash", schema_hash)
+    log.info("Command Schema Changed; Commands Re-Registered")
+
+
+@bot.listen("on_connect")
+async def prepare_on_connect() -> None:
+    await _prepare()
+
+
 @bot.event
 async def on_ready() -> None:
     global \
         start_time, \
-        repo_connected, \
         cogs_loaded, \
         startup_notified, \
-        skip_initial_notify
+        digest_task
 
-    if not repo_connected:
-        await repo.connect()
-        bot.repo = repo
-        bot.api_client = api_client
-        repo_connected = True
+    await _prepare()
 
     if not cogs_loaded:
+        phase_started = time.perf_counter()
         loaded_any = False
         for ext in COGS:
             try:
@@ -68,16 +230,18 @@ async def on_ready() -> None:
             except Exception:
                 log.exception("Failed to load cog: %s", ext)
 
+        startup_timeline["Cog Import"] = time.perf_counter() - phase_started
+
         if loaded_any:
-            await bot.sync_commands(force=True)
+            phase_started = time.perf_counter()
+            await _sync_commands_if_changed()
+            startup_timeline["Command Sync"] = time.perf_counter() - phase_started
+
             cogs_loaded = True
             log.info("Commands synced; %s cogs loaded", len(bot.cogs))
         else:
             log.error("No cogs loaded; commands will not be available")
 
-    if not giveaway_poll.is_running():
-        giveaway_poll.start()
-
     start_time = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
     bot.start_time = start_time
 
@@ -85,8 +249,22 @@ async def on_ready() -> None:
 
     if not startup_notified:
         startup_notified = True
-        skip_initial_notify = True
         await _startup_confirmation()
+        await _deliver_outbox()
+
+    if not giveaway_poll.is_running():
+        await _restore_poll_interval()
+        giveaway_poll.start()
+
+    if digest_task is None or digest_task.done():
+        digest_task = asyncio.create_task(_run_digests())
+
+    if "Ready" not in startup_timeline:
+        startup_timeline["Ready"] = time.perf_counter() - boot_started
+        log.info(
+            "Startup Timeline : %s",
+            ", ".join(f"{name} {secs:.2f}s" for name, secs in startup_timeline.items()),
+        )
 
     loaded_commands = [cmd.name for cmd in bot.walk_application_commands()]
 
@@ -95,133 +273,594 @@ async def on_ready() -> None:
     )
 
 
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
+    channels.forget(channel.id)
+    if repo_connected:
+        await repo.remove_channel_routes(channel.id)
+        for guild_id in await repo.set_channel_dormant(channel.id):
+            log.info("Notification Channel Deleted; Guild %s Is Now Dormant", guild_id)
+
+
+@bot.event
+async def on_guild_remove(guild: discord.Guild) -> None:
+    if repo_connected:
+        await repo.set_guild_dormant(guild.id, True)
+        log.info("Removed From Guild %s; Marked Dormant", guild.id)
+
+
+@bot.event
+async def on_guild_join(guild: discord.Guild) -> None:
+    if repo_connected:
+        await repo.set_guild_dormant(guild.id, False)
+
+
 @tasks.loop(seconds=settings.poll_interval_seconds)
 async def giveaway_poll() -> None:
     await bot.wait_until_ready()
-    await _notify_new_giveaways()
+    outcome = await _notify_new_giveaways()
+    await _reschedule_poll(outcome)
 
 
-async def _notify_new_giveaways() -> None:
-    global skip_initial_notify
+async def _restore_poll_interval() -> None:
+    stored = await repo.get_bot_state("poll_interval_seconds")
+    reason = await repo.get_bot_state("poll_interval_reason") or "Restored"
 
-    if skip_initial_notify:
-        skip_initial_notify = False
-        log.info("Skipping Initial RSS Notification After Startup Check")
+    if stored:
+        poll_schedule.restore(float(stored), reason)
+        giveaway_poll.change_interval(seconds=poll_schedule.next_delay())
 
-        return
 
+async def _reschedule_poll(outcome: PollOutcome) -> None:
+    delay = poll_schedule.advance(outcome)
+    giveaway_poll.change_interval(seconds=delay)
+
+    await repo.set_bot_state("poll_interval_seconds", f"{poll_schedule.interval:.0f}")
+    await repo.set_bot_state("poll_interval_reason", poll_schedule.reason)
+    log.info("Next Poll In %.0fs (%s)", delay, poll_schedule.reason)
+
+
+async def _notify_new_giveaways() -> PollOutcome:
     giveaways = await _fetch_latest_giveaways()
-    if not giveaways:
+    if giveaways is None:
+        return PollOutcome.FAILED
+
+    current = snapshot_digest(giveaways)
+    diff = diff_snapshots(await repo.get_poll_snapshot(), current)
+    if diff:
+        changed = {
+            giveaway_id: current[giveaway_id]
+            for giveaway_id in diff.added | diff.changed
+        }
+        await repo.update_poll_snapshot(changed, diff.removed)
+
+    log.info(
+        "Snapshot Diff : %s Added, %s Removed, %s Changed",
+        len(diff.added),
+        len(diff.removed),
+        len(diff.changed),
+    )
+
+    if diff.added or confirmed or await repo.has_lagging_guilds():
+        await _record_deliveries(giveaways)
+
+    await _deliver_outbox()
+
+    if diff.added:
+        return PollOutcome.NEW
+    if diff:
+        return PollOutcome.CHANGED
+    return PollOutcome.UNCHANGED
+
+
+async def _record_deliveries(giveaways: List[Giveaway]) -> None:
+    seqs = await repo.record_seen([str(giveaway.id) for giveaway in giveaways])
+    if not seqs:
+        return
+
+    lagging = await repo.get_lagging_guilds(max(seqs.values()))
+    if lagging:
+        await _enqueue_deliveries(giveaways, seqs, lagging)
+    if confirmed:
+        await _enqueue_confirmed(seqs, lagging)
+
+    await repo.prune_seen(min(seqs.values()))
+
+
+async def _enqueue_deliveries(
+    giveaways: List[Giveaway], seqs: Dict[str, int], lagging: Dict[int, Optional[int]]
+) -> None:
+    behind: Dict[int, Set[int]] = {}
+    for guild_id, mark in lagging.items():
+        behind.setdefault(mark or 0, set()).add(guild_id)
+
+    unfiltered = filters.unfiltered(lagging)
+    index = await _route_index()
+
+    rows: List[Tuple[int, str]] = []
+    for giveaway in giveaways:
+        seq = seqs[str(giveaway.id)]
+        groups = [guild_ids for mark, guild_ids in behind.items() if mark < seq]
+        if not groups:
+            continue
+
+        audience = groups[0] if len(groups) == 1 else set().union(*groups)
+        matched = (unfiltered | _subscribed_guilds(giveaway, index)) & audience
+        rows.extend((guild_id, str(giveaway.id)) for guild_id in matched)
+
+    await repo.enqueue_outbox(rows, lagging, max(seqs.values()))
+    log.info("Queued %s Deliveries", len(rows))
+
+
+async def _enqueue_confirmed(
+    seqs: Dict[str, int], lagging: Dict[int, Optional[int]]
+) -> None:
+    global confirmed
+
+    upgrades, confirmed = confirmed, {}
+    index = await _route_index()
+
+    rows: List[Tuple[int, str]] = []
+    for giveaway_id, (before, after) in upgrades.items():
+        seq = seqs.get(str(giveaway_id))
+        if seq is None:
+            continue
+
+        gained = _subscribed_guilds(after, index) - _subscribed_guilds(before, index)
+        gained -= filters.unfiltered(gained)
+        rows.extend(
+            (guild_cfg.guild_id, str(giveaway_id))
+            for guild_cfg in await repo.get_guilds(gained)
+            if (lagging.get(guild_cfg.guild_id, seq) or 0) >= seq
+        )
+
+    if rows:
+        await repo.enqueue_outbox(rows)
+    log.info("Queued %s Deliveries For Giveaways Confirmed By The API", len(rows))
+
+
+def _subscribed_guilds(giveaway: Giveaway, index: FilterIndex) -> Set[int]:
+    routed = {route_owners[cid] for cid in index.route(giveaway)}
+    return filters.route(giveaway) | routed
+
+
+def _track_provisional(giveaways: List[Giveaway], api_items: List[Giveaway]) -> bool:
+    global provisional
+
+    current = rss_only(giveaways, api_items)
+    for giveaway in giveaways:
+        before = provisional.get(giveaway.id)
+        if before is not None and giveaway.id not in current:
+            confirmed[giveaway.id] = (before, giveaway)
+
+    changed = current.keys() != provisional.keys()
+    provisional = current
+    return changed
+
+
+async def _route_index() -> FilterIndex:
+    global route_index, route_owners, routes_version
+
+    if routes_version != repo.routes_version:
+        version = repo.routes_version
+        index = FilterIndex()
+        owners: Dict[int, int] = {}
+
+        for routes in (await repo.get_routes()).values():
+            for route in routes:
+                index.update(route.channel_id, route.filter)
+                owners[route.channel_id] = route.guild_id
+
+        route_index, route_owners, routes_version = index, owners, version
+
+    return route_index
+
+
+async def _deliver_outbox() -> None:
+    if not len(catalog):
         return
 
-    guilds = await repo.get_all_guilds()
+    guilds = await repo.get_outbox_guilds()
     if not guilds:
         return
 
-    for guild_cfg in guilds:
-        await _notify_guild(guild_cfg.guild_id, guild_cfg.channel_id, giveaways)
+    report = await fan_out(
+        guilds,
+        _notify_guild,
+        concurrency=settings.fanout_concurrency,
+        deadline_seconds=settings.fanout_deadline_seconds,
+    )
+    await _record_fanout("Notification", report)
 
 
 async def _startup_confirmation() -> None:
     await bot.wait_until_ready()
 
-    guilds = await repo.get_all_guilds()
-    if not guilds:
+    if not repo.has_guilds():
         return
 
-    giveaways = await _fetch_latest_giveaways()
+    if catalog.is_fresh(settings.catalog_max_age_seconds):
+        giveaways = catalog.query()
+    else:
+        giveaways = await _fetch_latest_giveaways()
     if not giveaways:
         return
 
-    latest = giveaways[0]
-    for guild_cfg in guilds:
-        await _send_startup_latest(guild_cfg.guild_id, guild_cfg.channel_id, latest)
+    await repo.record_seen([str(giveaway.id) for giveaway in giveaways])
+
+    async def confirm(guild_cfg: GuildSettings) -> bool:
+        if guild_cfg.digest_seconds:
+            return False
 
+        guild_filter = filters.get(guild_cfg.guild_id)
+        latest = next((g for g in giveaways if guild_filter.matches(g)), None)
+        if latest is None:
+            return False
 
-async def _fetch_latest_giveaways() -> List[Giveaway]:
+        return await _send_startup_latest(
+            guild_cfg.guild_id, guild_cfg.channel_id, latest
+        )
+
+    report = await fan_out(
+        repo.iter_guilds(),
+        confirm,
+        concurrency=settings.fanout_concurrency,
+        deadline_seconds=settings.fanout_deadline_seconds,
+    )
+    await _record_fanout("Startup", report)
+
+
+async def _record_fanout(label: str, report: FanoutReport) -> None:
+    log.info("%s Fan-Out : %s", label, report.summary())
+    await repo.set_bot_state("last_fanout_report", f"{label} : {report.summary()}")
+
+
+async def _fetch_latest_giveaways() -> Optional[List[Giveaway]]:
     try:
-        giveaways = await api_client.fetch_giveaways(sort_by="date")
+        api_items, rss_items = await asyncio.gather(
+            api_client.fetch_giveaways(sort_by="date"), rss.fetch_all()
+        )
+        if not api_items:
+            log.warning("Empty GamerPower Response, Keeping Previous Catalog")
+            return None
+
+        giveaways = merge_giveaways(api_items, rss_items, catalog)
+        catalog.replace(giveaways)
+        renders.retain(catalog.by_id)
+        await repo.save_catalog_snapshot(catalog.dumps(), time.time())
+        if _track_provisional(giveaways, api_items):
+            await repo.set_bot_state(
+                "provisional_giveaways", json.dumps(sorted(provisional))
+            )
         now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc).isoformat()
         await repo.set_bot_state("last_giveaway_check", now)
-        log.info("Fetched %s giveaways", len(giveaways))
+        log.info(
+            "Fetched %s giveaways (%s From RSS Ahead Of The API)",
+            len(giveaways),
+            len(giveaways) - len(api_items),
+        )
         return giveaways
+    except CircuitOpenError:
+        log.warning("Skipping Fetch While GamerPower Circuit Is Open")
+        return None
     except Exception:
         log.exception("Failed to fetch giveaways")
-        return []
+        return None
 
 
-async def _notify_guild(
-    guild_id: int, channel_id: int, giveaways: List[Giveaway]
-) -> None:
-    channel = bot.get_channel(channel_id)
+async def _notify_guild(guild_cfg: GuildSettings) -> bool:
+    guild_id = guild_cfg.guild_id
 
-    if channel is None:
-        try:
-            channel = await bot.fetch_channel(channel_id)
-        except discord.HTTPException:
-            log.warning("Unable To Fetch Channel %s For Guild %s", channel_id, guild_id)
-            return
+    claimed = await repo.claim_outbox(guild_id)
+    if not claimed:
+        return False
 
-    if not isinstance(channel, (discord.TextChannel, discord.Thread)):
-        log.warning("Configured Channel %s Is Not Text Capable", channel_id)
-        return
+    unsettled = set(claimed)
+    try:
+        return await _deliver_claimed(guild_cfg, claimed, unsettled)
+    finally:
+        if unsettled:
+            await asyncio.shield(
+                repo.release_outbox(
+                    guild_id,
+                    [gid for gid in claimed if gid in unsettled],
+                    settings.outbox_max_attempts,
+                )
+            )
+
+
+async def _deliver_claimed(
+    guild_cfg: GuildSettings, claimed: List[str], unsettled: Set[str]
+) -> bool:
+    guild_id, channel_id = guild_cfg.guild_id, guild_cfg.channel_id
+
+    if guild_cfg.digest_seconds:
+        handled = await _defer_to_digest(guild_cfg, claimed)
+        unsettled.clear()
+        return handled
+
+    channel = await _resolve_channel(guild_id, channel_id)
+    if channel is None:
+        return False
 
     new_items: List[Giveaway] = []
-    for giveaway in giveaways:
-        giveaway_id = str(giveaway.id)
-        if not await repo.already_notified(guild_id, giveaway_id):
+    expired: List[str] = []
+    for giveaway_id in claimed:
+        giveaway = catalog.get(int(giveaway_id))
+        if giveaway is None:
+            expired.append(giveaway_id)
+        else:
             new_items.append(giveaway)
 
+    await repo.drop_outbox(guild_id, expired)
+    unsettled.difference_update(expired)
     if not new_items:
-        return
+        return True
+
+    guild_filter = filters.get(guild_id)
+    sent = await repo.get_outbox_sent(guild_id)
+    missed: Set[int] = set()
+    targets: List[Tuple[TextTarget, List[Giveaway]]] = [
+        (channel, [item for item in new_items if guild_filter.matches(item)])
+    ]
+
+    for route in await repo.get_guild_routes(guild_id):
+        items = [
+            giveaway
+            for giveaway in new_items
+            if route.filter.matches(giveaway)
+            and (str(giveaway.id), route.channel_id) not in sent
+        ]
+        if not items:
+            continue
+
+        route_channel = await channels.resolve(route.channel_id)
+        if route_channel is None:
+            log.warning(
+                "Unable To Resolve Routed Channel %s For Guild %s",
+                route.channel_id,
+                guild_id,
+            )
+            missed.update(giveaway.id for giveaway in items)
+            continue
+
+        targets.append((route_channel, items))
+
+    owed: Dict[int, int] = {}
+    payloads: Dict[Tuple[int, ...], Dict[str, Any]] = {}
+    pending: List[Tuple[TextTarget, List[Giveaway], "asyncio.Future[Any]"]] = []
+
+    for target, items in targets:
+        items = [item for item in items if (str(item.id), target.id) not in sent]
+        for giveaway in items:
+            owed[giveaway.id] = owed.get(giveaway.id, 0) + 1
+
+        if guild_cfg.pack_embeds:
+            packs = renders.pack(items)
+        else:
+            packs = [[giveaway] for giveaway in items]
+
+        for pack in packs:
+            key = tuple(giveaway.id for giveaway in pack)
+            if key not in payloads:
+                payloads[key] = _message_payload(pack)
+            pending.append((target, pack, sender.submit(target, **payloads[key])))
 
-    keep_ids = [str(item.id) for item in giveaways][:200]
-    await repo.prune_notified(guild_id, keep_ids)
+    failure: Optional[BaseException] = None
+    sends = failures = 0
+    try:
+        if pending:
+            await asyncio.wait([future for _, _, future in pending])
+    finally:
+        sending = [
+            future
+            for _, _, future in pending
+            if not future.done() and not sender.withdraw(future)
+        ]
+        if sending:
+            await asyncio.shield(asyncio.wait(sending))
+
+        for target, pack, future in pending:
+            if future.cancelled():
+                continue
+
+            exc = future.exception()
+            if exc is not None:
+                failures += 1
+                log.warning(
+                    "Failed To Send Giveaways %s To Guild %s Channel %s",
+                    ", ".join(str(giveaway.id) for giveaway in pack),
+                    guild_id,
+                    target.id,
+                )
+                failure = failure or exc
+                continue
+
+            sends += 1
+            for giveaway in pack:
+                owed[giveaway.id] -= 1
+                sent.add((str(giveaway.id), target.id))
+
+        missed.update(giveaway_id for giveaway_id, count in owed.items() if count)
+        settled = [str(g.id) for g in new_items if g.id not in missed]
+        undelivered = [str(g.id) for g in new_items if g.id in missed]
+        await asyncio.shield(
+            _settle_outbox(
+                guild_id,
+                settled,
+                undelivered,
+                [pair for pair in sent if int(pair[0]) in missed],
+                sends,
+                failures,
+            )
+        )
+        unsettled.clear()
+
+    if failure is not None:
+        raise failure
+
+    return True
+
+
+async def _defer_to_digest(guild_cfg: GuildSettings, claimed: List[str]) -> bool:
+    guild_id = guild_cfg.guild_id
+    live = [giveaway_id for giveaway_id in claimed if catalog.get(int(giveaway_id))]
+
+    await repo.drop_outbox(guild_id, [gid for gid in claimed if gid not in live])
+    await repo.defer_to_digest(guild_id, live)
+
+    if live and digests.due_at(guild_id) is None:
+        await _schedule_digest(guild_id, time.time() + guild_cfg.digest_seconds)
+    return bool(live)
+
+
+async def _schedule_digest(guild_id: int, due_at: Optional[float]) -> None:
+    if due_at is None:
+        digests.cancel(guild_id)
+    else:
+        digests.schedule(guild_id, due_at)
+    await repo.set_digest_next(guild_id, due_at)
+
+
+async def _run_digests() -> None:
+    while True:
+        digests.changed.clear()
+        now = time.time()
+        next_due = digests.next_due()
+
+        if next_due is None or next_due > now:
+            timeout = None if next_due is None else next_due - now
+            try:
+                await asyncio.wait_for(digests.changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            continue
 
-    for giveaway in new_items:
         try:
-            embed = giveaway_embed(giveaway)
-            view = GiveawayView(giveaway.open_giveaway_url)
-            await channel.send(embed=embed, view=view)
-            await repo.mark_notified(guild_id, str(giveaway.id))
+            guilds = await repo.get_guilds(digests.pop_due(now))
+            report = await fan_out(
+                guilds,
+                _flush_digest,
+                concurrency=settings.fanout_concurrency,
+                deadline_seconds=settings.fanout_deadline_seconds,
+            )
+            await _record_fanout("Digest", report)
+        except Exception:
+            log.exception("Digest Flush Failed")
 
+
+async def _flush_digest(guild_cfg: GuildSettings) -> bool:
+    try:
+        return await _send_digest(guild_cfg)
+    finally:
+        await asyncio.shield(_reschedule_digest(guild_cfg))
+
+
+async def _reschedule_digest(guild_cfg: GuildSettings) -> None:
+    guild_id = guild_cfg.guild_id
+
+    if guild_cfg.digest_seconds:
+        await _schedule_digest(guild_id, time.time() + guild_cfg.digest_seconds)
+    elif await repo.get_digest_pending(guild_id):
+        await _schedule_digest(guild_id, time.time() + settings.poll_interval_seconds)
+    else:
+        await _schedule_digest(guild_id, None)
+
+
+async def _send_digest(guild_cfg: GuildSettings) -> bool:
+    guild_id = guild_cfg.guild_id
+    pending = await repo.get_digest_pending(guild_id)
+
+    items = [catalog.get(int(giveaway_id)) for giveaway_id in pending]
+    expired = [gid for gid, item in zip(pending, items) if item is None]
+    await repo.clear_digest_pending(guild_id, expired)
+
+    giveaways = [item for item in items if item is not None]
+    if not giveaways:
+        return False
+
+    channel = await _resolve_channel(guild_id, guild_cfg.channel_id)
+    if channel is None:
+        return False
+
+    for embeds, ids in digest_messages(giveaways):
+        try:
+            await sender.send(channel, embeds=embeds)
         except discord.HTTPException:
-            log.exception(
-                "Failed To Send Giveaway %s To Guild %s Channel %s",
-                giveaway.id,
+            await repo.record_failures(guild_id)
+            log.warning(
+                "Failed To Send Digest Of %s Giveaways To Guild %s Channel %s",
+                len(giveaways),
                 guild_id,
-                channel_id,
+                guild_cfg.channel_id,
             )
-            break
+            raise
 
+        await repo.clear_digest_pending(
+            guild_id, [str(giveaway_id) for giveaway_id in ids], sends=1
+        )
 
-async def _send_startup_latest(
-    guild_id: int, channel_id: int, giveaway: Giveaway
-) -> None:
-    channel = bot.get_channel(channel_id)
+    return True
+
+
+def _message_payload(pack: List[Giveaway]) -> Dict[str, Any]:
+    if len(pack) == 1:
+        rendered = renders.render(pack[0])
+        return {"embed": rendered.embed, "view": rendered.view}
+
+    return {
+        "embeds": [renders.render(giveaway).embed for giveaway in pack],
+        "view": PackedGiveawayView(pack),
+    }
+
+
+async def _resolve_channel(guild_id: int, channel_id: int) -> Optional[TextTarget]:
+    channel = await channels.resolve(channel_id)
 
     if channel is None:
-        try:
-            channel = await bot.fetch_channel(channel_id)
+        log.warning("Unable To Resolve Channel %s For Guild %s", channel_id, guild_id)
+        if channels.failures(channel_id) >= settings.channel_failure_limit:
+            await repo.set_guild_dormant(guild_id, True)
+            log.warning("Marked Guild %s Dormant After Repeated Failures", guild_id)
 
-        except discord.HTTPException:
-            log.warning("Unable To Fetch Channel %s For Guild %s", channel_id, guild_id)
-            return
+    return channel
 
-    if not isinstance(channel, (discord.TextChannel, discord.Thread)):
-        log.warning("Configured Channel %s Is Not Text Capable", channel_id)
-        return
+
+async def _settle_outbox(
+    guild_id: int,
+    delivered: List[str],
+    undelivered: List[str],
+    sent: List[Tuple[str, int]],
+    sends: int,
+    failures: int,
+) -> None:
+    await repo.complete_outbox(guild_id, delivered, sends, failures)
+    await repo.release_outbox(
+        guild_id, undelivered, settings.outbox_max_attempts, sent
+    )
+    await repo.durable()
+
+
+async def _send_startup_latest(
+    guild_id: int, channel_id: int, giveaway: Giveaway
+) -> bool:
+    channel = await _resolve_channel(guild_id, channel_id)
+    if channel is None:
+        return False
 
     try:
-        embed = giveaway_embed(giveaway)
-        view = GiveawayView(giveaway.open_giveaway_url)
-        await channel.send(embed=embed, view=view)
-        await repo.mark_notified(guild_id, str(giveaway.id))
+        rendered = renders.render(giveaway)
+        await sender.send(channel, embed=rendered.embed, view=rendered.view)
+        await repo.mark_notified(guild_id, str(giveaway.id), sends=1)
 
     except discord.HTTPException:
-        log.exception(
+        await repo.record_failures(guild_id)
+        log.warning(
             "Failed To Send Startup Giveaway %s To Guild %s Channel %s",
             giveaway.id,
             guild_id,
             channel_id,
         )
+        raise
+
+    return True
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Set
+
+from .gamerpower import PLATFORMS, Giveaway
+
+
+class GiveawayCatalog:
+    def __init__(self) -> None:
+        self.fetched_at: Optional[float] = None
+
+        self.by_id: Dict[int, Giveaway] = {}
+        self.by_platform: Dict[str, Set[int]] = {}
+        self.by_type: Dict[str, Set[int]] = {}
+
+        self._orderings: Dict[str, List[int]] = {
+            "date": [],
+            "value": [],
+            "popularity": [],
+        }
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def age_seconds(self) -> Optional[float]:
+        if self.fetched_at is None:
+            return None
+        return time.monotonic() - self.fetched_at
+
+    def is_fresh(self, max_age_seconds: float) -> bool:
+        age = self.age_seconds()
+        return age is not None and age <= max_age_seconds
+
+    def replace(
+        self, giveaways: Iterable[Giveaway], *, age_seconds: float = 0.0
+    ) -> None:
+        by_id: Dict[int, Giveaway] = {}
+        by_platform: Dict[str, Set[int]] = {}
+        by_type: Dict[str, Set[int]] = {}
+        date_order: List[int] = []
+
+        for giveaway in giveaways:
+            if giveaway.id in by_id:
+                continue
+
+            by_id[giveaway.id] = giveaway
+            date_order.append(giveaway.id)
+
+            for index, (slug, _) in enumerate(PLATFORMS):
+                if giveaway.platform_mask >> index & 1:
+                    by_platform.setdefault(slug, set()).add(giveaway.id)
+
+            by_type.setdefault(giveaway.kind.value, set()).add(giveaway.id)
+
+        self.by_id = by_id
+        self.by_platform = by_platform
+        self.by_type = by_type
+        self._orderings = {
+            "date": date_order,
+            "value": sorted(
+                date_order, key=lambda gid: by_id[gid].worth_cents or 0, reverse=True
+            ),
+            "popularity": sorted(
+                date_order, key=lambda gid: by_id[gid].users, reverse=True
+            ),
+        }
+        self.fetched_at = time.monotonic() - age_seconds
+
+    def dumps(self) -> bytes:
+        rows = [self.by_id[gid].to_row() for gid in self._orderings["date"]]
+        return zlib.compress(json.dumps(rows, separators=(",", ":")).encode())
+
+    @staticmethod
+    def loads(payload: bytes) -> List[Giveaway]:
+        rows = json.loads(zlib.decompress(payload))
+        return [Giveaway.from_row(row) for row in rows]
+
+    def get(self, giveaway_id: int) -> Optional[Giveaway]:
+        return self.by_id.get(giveaway_id)
+
+    def _matching_ids(
+        self, platform: Optional[str], type_: Optional[str]
+    ) -> Optional[Set[int]]:
+        selected: Optional[Set[int]] = None
+
+        if platform:
+            selected = self.by_platform.get(platform, set())
+
+        if type_:
+            type_ids = self.by_type.get(type_, set())
+            selected = type_ids if selected is None else selected & type_ids
+
+        return selected
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        type_: Optional[str] = None,
+        sort_by: Optional[str] = None,
+    ) -> List[Giveaway]:
+        ordering = self._orderings.get(sort_by or "date", self._orderings["date"])
+        selected = self._matching_ids(platform, type_)
+
+        if selected is None:
+            return [self.by_id[gid] for gid in ordering]
+
+        return [self.by_id[gid] for gid in ordering if gid in selected]
+
+    def worth(
+        self, platform: Optional[str] = None, type_: Optional[str] = None
+    ) -> Dict[str, object]:
+        selected = self._matching_ids(platform, type_)
+        ids = self.by_id.keys() if selected is None else selected
+
+        total = sum(self.by_id[gid].worth_cents or 0 for gid in ids)
+        return {
+            "active_giveaways_number": len(ids),
+            "worth_estimation_usd": f"{total / 100:.2f}",
+        }
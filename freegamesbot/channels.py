@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+import discord
+
+log = logging.getLogger(__name__)
+
+TextTarget = Union[discord.TextChannel, discord.Thread]
+
+
+@dataclass
+class ResolutionFailure:
+    failures: int
+    retry_at: float
+
+
+class ChannelResolver:
+    def __init__(
+        self,
+        bot: discord.Client,
+        *,
+        retry_base_seconds: float = 900.0,
+        retry_max_seconds: float = 86400.0,
+    ) -> None:
+        self.bot = bot
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+        self.fetches = 0
+        self.negative_hits = 0
+
+        self._resolved: Dict[int, TextTarget] = {}
+        self._failures: Dict[int, ResolutionFailure] = {}
+
+    def failures(self, channel_id: int) -> int:
+        failure = self._failures.get(channel_id)
+        return failure.failures if failure else 0
+
+    def forget(self, channel_id: int) -> None:
+        self._resolved.pop(channel_id, None)
+        self._failures.pop(channel_id, None)
+
+    def _record_failure(self, channel_id: int) -> None:
+        self._resolved.pop(channel_id, None)
+        failure = self._failures.get(channel_id)
+        count = failure.failures + 1 if failure else 1
+        backoff = min(
+            self.retry_max_seconds, self.retry_base_seconds * 2 ** (count - 1)
+        )
+
+        self._failures[channel_id] = ResolutionFailure(
+            failures=count, retry_at=time.monotonic() + backoff
+        )
+
+    async def resolve(self, channel_id: int) -> Optional[TextTarget]:
+        channel = self.bot.get_channel(channel_id) or self._resolved.get(channel_id)
+
+        if channel is None:
+            failure = self._failures.get(channel_id)
+            if failure and failure.retry_at > time.monotonic():
+                self.negative_hits += 1
+                return None
+
+            self.fetches += 1
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except (discord.Forbidden, discord.NotFound):
+                log.warning("Channel %s Is Gone Or Inaccessible", channel_id)
+                self._record_failure(channel_id)
+                return None
+            except discord.HTTPException:
+                log.warning("Unable To Fetch Channel %s", channel_id)
+                return None
+
+        if not isinstance(channel, (discord.TextChannel, discord.Thread)):
+            log.warning("Configured Channel %s Is Not Text Capable", channel_id)
+            self._record_failure(channel_id)
+            return None
+
+        self._resolved[channel_id] = channel
+        self._failures.pop(channel_id, None)
+        return channel
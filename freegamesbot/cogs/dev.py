@@ -72,6 +72,9 @@ class DevCog(commands.Cog):
 
         last_rss_check = await self.repo.get_bot_state("last_giveaway_check")
         last_status_link = await self.repo.get_bot_state("last_status_message_url")
+        last_fanout = await self.repo.get_bot_state("last_fanout_report")
+        poll_interval = await self.repo.get_bot_state("poll_interval_seconds")
+        poll_reason = await self.repo.get_bot_state("poll_interval_reason")
 
         embed = discord.Embed(
             title="Bot Health",
@@ -85,9 +88,78 @@ class DevCog(commands.Cog):
         embed.add_field(
             name="Configured Feeds", value=str(len(getattr(settings, "rss_feeds", []))), inline=False
         )
+        rss = getattr(self.bot, "rss", None)
+        if rss is not None:
+            embed.add_field(
+                name="RSS Ingestion",
+                value=(
+                    f"Fetched {rss.stats.fetched} • "
+                    f"Not Modified {rss.stats.not_modified} • "
+                    f"Failed {rss.stats.failed} • Entries {rss.stats.entries}"
+                ),
+                inline=False,
+            )
         embed.add_field(
             name="Last API Check", value=_format_iso(last_rss_check), inline=False
         )
+        embed.add_field(
+            name="Poll Interval",
+            value=(
+                f"{poll_interval}s ({poll_reason})"
+                if poll_interval
+                else f"{settings.poll_interval_seconds}s (Configured Default)"
+            ),
+            inline=False,
+        )
+        embed.add_field(
+            name="Last Fan-Out", value=last_fanout or "Not Run Yet", inline=False
+        )
+        api_client = getattr(self.bot, "api_client", None)
+        if api_client is not None:
+            stats = api_client.cache.stats
+            embed.add_field(
+                name="API Cache",
+                value=(
+                    f"Hits {stats.hits} • Misses {stats.misses} • "
+                    f"Revalidated {stats.revalidated} • Coalesced {stats.coalesced} • "
+                    f"Stale {stats.stale} • Entries {len(api_client.cache)}"
+                ),
+                inline=False,
+            )
+            breaker = api_client.breaker
+            embed.add_field(
+                name="API Circuit",
+                value=(
+                    f"{breaker.state.title()} • Opened {breaker.stats.opened} • "
+                    f"Half-Opened {breaker.stats.half_opened} • "
+                    f"Closed {breaker.stats.closed} • "
+                    f"Rejected {breaker.stats.rejected} • "
+                    f"Retries {breaker.stats.retries}"
+                ),
+                inline=False,
+            )
+        sender = getattr(self.bot, "sender", None)
+        if sender is not None:
+            send_stats = sender.stats
+            embed.add_field(
+                name="Send Queue",
+                value=(
+                    f"Depth {sender.queue_depth} • Sent {send_stats.sent} • "
+                    f"Failed {send_stats.failed} • 429s {send_stats.rate_limited} • "
+                    f"Wait avg {send_stats.average_wait:.1f}s / max {send_stats.max_wait:.1f}s"
+                ),
+                inline=False,
+            )
+        stats = self.repo.stats
+        sends_today, failures_today = stats.today()
+        embed.add_field(
+            name="Deliveries",
+            value=(
+                f"Today {sends_today} Sent • {failures_today} Failed • "
+                f"Total {stats.sends} Sent • {stats.failures} Failed"
+            ),
+            inline=False,
+        )
         embed.add_field(
             name="Last Status Message",
             value=last_status_link or "Not Saved Yet",
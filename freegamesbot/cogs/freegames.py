@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import time
+import asyncio
 import logging
-from typing import List, Optional
+import dataclasses
+from typing import Awaitable, Callable, List, Optional
 
 import discord
 from discord import OptionChoice
 from discord.ext import commands
 
-from ..db import SettingsRepository
+from ..config import settings
+from ..db import GuildRoute, SettingsRepository
+from ..digest import DIGEST_INTERVALS, DigestSchedule
+from ..catalog import GiveawayCatalog
+from ..channels import ChannelResolver
 from ..embeds import giveaway_embed
 from ..pagination import EmbedPaginator
-from ..gamerpower import GamerPowerClient, Giveaway
+from ..filters import FilterIndex, GuildFilter, parse_keywords
+from ..gamerpower import (
+    GamerPowerClient,
+    Giveaway,
+    GiveawayType,
+    platform_mask,
+)
 
 log = logging.getLogger(__name__)
 
@@ -45,12 +58,58 @@ SORT_CHOICES = [
 ]
 
 
+def filter_options(func):
+    for decorator in (
+        discord.option(
+            "platforms",
+            input_type=str,
+            description="Comma-Separated Platforms, e.g. pc, steam (any To Reset)",
+            required=False,
+        ),
+        discord.option(
+            "types",
+            input_type=str,
+            description="Comma-Separated Types: game, loot, beta (any To Reset)",
+            required=False,
+        ),
+        discord.option(
+            "min_worth",
+            input_type=float,
+            description="Minimum Worth In USD (0 To Reset)",
+            min_value=0,
+            required=False,
+        ),
+        discord.option(
+            "include",
+            input_type=str,
+            description="Comma-Separated Title Keywords To Require (none To Reset)",
+            required=False,
+        ),
+        discord.option(
+            "exclude",
+            input_type=str,
+            description="Comma-Separated Title Keywords To Skip (none To Reset)",
+            required=False,
+        ),
+    ):
+        func = decorator(func)
+    return func
+
+
 class FreeGamesCog(commands.Cog):
     def __init__(self, bot: discord.Bot) -> None:
         self.bot = bot
 
         self.repo: SettingsRepository = bot.repo
         self.api: GamerPowerClient = bot.api_client
+        self.catalog: GiveawayCatalog = bot.catalog
+        self.filters: FilterIndex = bot.filters
+        self.digests: DigestSchedule = bot.digests
+        self.channels: ChannelResolver = bot.channels
+        self.fetch_latest_giveaways: Callable[
+            [], Awaitable[Optional[List[Giveaway]]]
+        ] = bot.fetch_latest_giveaways
+        self._refresh_task: Optional[asyncio.Task[bool]] = None
 
     freegames = discord.SlashCommandGroup("freegames", "Free games utilities")
 
@@ -74,11 +133,341 @@ class FreeGamesCog(commands.Cog):
     ) -> None:
         assert ctx.guild_id, "Guild-only Command"
         await self.repo.set_guild_channel(ctx.guild_id, channel.id)
+        self.channels.forget(channel.id)
         await ctx.respond(
             f"Got It! New Giveaways Will Be Posted In {channel.mention}.",
             ephemeral=True,
         )
 
+    @freegames.command(
+        description="Pack New Giveaways Into Messages Of Up To 10 Embeds",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    @discord.default_permissions(manage_guild=True)
+    @discord.option(
+        "enabled",
+        input_type=bool,
+        description="Group New Giveaways Into Shared Messages",
+    )
+    async def packing(
+        self,
+        ctx: discord.ApplicationContext,
+        enabled: bool,
+    ) -> None:
+        assert ctx.guild_id, "Guild-only Command"
+        if not await self.repo.set_guild_packing(ctx.guild_id, enabled):
+            await ctx.respond(
+                "No Channel Configured. Use /freegames set-channel First.",
+                ephemeral=True,
+            )
+            return
+
+        state = "Packed Into Shared Messages" if enabled else "Posted One Per Message"
+        await ctx.respond(f"Got It! New Giveaways Will Be {state}.", ephemeral=True)
+
+    @freegames.command(
+        description="Collect New Giveaways Into A Periodic Digest Message",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    @discord.default_permissions(manage_guild=True)
+    @discord.option(
+        "interval",
+        input_type=str,
+        description="How Often To Post The Digest",
+        choices=["Off", *DIGEST_INTERVALS],
+    )
+    async def digest(self, ctx: discord.ApplicationContext, interval: str) -> None:
+        assert ctx.guild_id, "Guild-only Command"
+        seconds = DIGEST_INTERVALS.get(interval, 0)
+        due_at = time.time() + seconds
+
+        if not await self.repo.set_guild_digest(ctx.guild_id, seconds, due_at):
+            await ctx.respond(
+                "No Channel Configured. Use /freegames set-channel First.",
+                ephemeral=True,
+            )
+            return
+
+        self.digests.schedule(ctx.guild_id, due_at)
+        if seconds:
+            await ctx.respond(
+                f"Got It! New Giveaways Will Be Posted As A Digest {interval}.",
+                ephemeral=True,
+            )
+        else:
+            await ctx.respond(
+                "Got It! Digest Disabled; Pending Giveaways Will Be Posted Now.",
+                ephemeral=True,
+            )
+
+    @freegames.command(
+        name="filter",
+        description="Only Post Giveaways Matching These Filters",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    @discord.default_permissions(manage_guild=True)
+    @filter_options
+    async def set_filter(
+        self,
+        ctx: discord.ApplicationContext,
+        platforms: Optional[str] = None,
+        types: Optional[str] = None,
+        min_worth: Optional[float] = None,
+        include: Optional[str] = None,
+        exclude: Optional[str] = None,
+    ) -> None:
+        assert ctx.guild_id, "Guild-only Command"
+        guild_filter = await self._build_filter(
+            ctx,
+            self.filters.get(ctx.guild_id),
+            platforms,
+            types,
+            min_worth,
+            include,
+            exclude,
+        )
+        if guild_filter is None:
+            return
+
+        if not await self.repo.set_guild_filter(ctx.guild_id, guild_filter):
+            await ctx.respond(
+                "No Channel Configured. Use /freegames set-channel First.",
+                ephemeral=True,
+            )
+            return
+
+        self.filters.update(ctx.guild_id, guild_filter)
+        await ctx.respond(embed=self._filter_embed(guild_filter), ephemeral=True)
+
+    @freegames.command(
+        name="filters",
+        description="Show The Notification Filters For This Server",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    async def show_filters(self, ctx: discord.ApplicationContext) -> None:
+        if ctx.guild_id is None:
+            await ctx.respond(
+                "This Command Can Only Be Used In Servers.", ephemeral=True
+            )
+            return
+
+        await ctx.respond(
+            embed=self._filter_embed(self.filters.get(ctx.guild_id)), ephemeral=True
+        )
+
+    @freegames.command(
+        description="Remove All Notification Filters For This Server",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    @discord.default_permissions(manage_guild=True)
+    async def clear_filters(self, ctx: discord.ApplicationContext) -> None:
+        assert ctx.guild_id, "Guild-only Command"
+        await self.repo.clear_guild_filter(ctx.guild_id)
+        self.filters.discard(ctx.guild_id)
+        await ctx.respond(
+            "Got It! Every New Giveaway Will Be Posted Again.", ephemeral=True
+        )
+
+    async def _build_filter(
+        self,
+        ctx: discord.ApplicationContext,
+        base: GuildFilter,
+        platforms: Optional[str],
+        types: Optional[str],
+        min_worth: Optional[float],
+        include: Optional[str],
+        exclude: Optional[str],
+    ) -> Optional[GuildFilter]:
+        changes = {}
+
+        if platforms is not None:
+            mask, unknown = (0, None)
+            if platforms.strip().lower() != "any":
+                mask, unknown = platform_mask(platforms)
+            if unknown:
+                await ctx.respond(f"Unknown Platforms : {unknown}.", ephemeral=True)
+                return None
+            changes["platform_mask"] = mask
+
+        if types is not None:
+            values = set()
+            if types.strip().lower() != "any":
+                for name in types.split(","):
+                    kind = GiveawayType.parse(name)
+                    if kind is GiveawayType.OTHER and name.strip().lower() != "other":
+                        await ctx.respond(
+                            f"Unknown Type : {name.strip()}.", ephemeral=True
+                        )
+                        return None
+                    values.add(kind.value)
+            changes["types"] = frozenset(values)
+
+        if min_worth is not None:
+            changes["min_worth_cents"] = round(min_worth * 100) or None
+
+        if include is not None:
+            changes["include"] = (
+                () if include.strip().lower() == "none" else parse_keywords(include)
+            )
+
+        if exclude is not None:
+            changes["exclude"] = (
+                () if exclude.strip().lower() == "none" else parse_keywords(exclude)
+            )
+
+        return dataclasses.replace(base, **changes)
+
+    @staticmethod
+    def _filter_embed(guild_filter: GuildFilter) -> discord.Embed:
+        embed = discord.Embed(
+            title="Notification Filters",
+            description=(
+                "Every New Giveaway Is Posted."
+                if guild_filter.is_empty
+                else "Only Giveaways Matching All Filters Are Posted."
+            ),
+            color=discord.Color.blurple(),
+        )
+        for name, value in guild_filter.describe().items():
+            embed.add_field(name=name, value=value, inline=True)
+        return embed
+
+    @freegames.command(
+        description="Also Post Giveaways Matching These Filters To Another Channel",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    @discord.default_permissions(manage_guild=True)
+    @discord.option(
+        "channel",
+        description="Channel That Receives The Matching Giveaways",
+        type=discord.TextChannel,
+    )
+    @filter_options
+    async def route(
+        self,
+        ctx: discord.ApplicationContext,
+        channel: discord.TextChannel,
+        platforms: Optional[str] = None,
+        types: Optional[str] = None,
+        min_worth: Optional[float] = None,
+        include: Optional[str] = None,
+        exclude: Optional[str] = None,
+    ) -> None:
+        assert ctx.guild_id, "Guild-only Command"
+        if channel.id == await self.repo.get_guild_channel(ctx.guild_id):
+            await ctx.respond(
+                "That Is The Main Channel. Use /freegames filter Instead.",
+                ephemeral=True,
+            )
+            return
+
+        current = next(
+            (
+                route.filter
+                for route in await self.repo.get_guild_routes(ctx.guild_id)
+                if route.channel_id == channel.id
+            ),
+            GuildFilter(),
+        )
+        route_filter = await self._build_filter(
+            ctx, current, platforms, types, min_worth, include, exclude
+        )
+        if route_filter is None:
+            return
+
+        route = GuildRoute(ctx.guild_id, channel.id, route_filter)
+        if not await self.repo.set_guild_route(route):
+            await ctx.respond(
+                "No Channel Configured. Use /freegames set-channel First.",
+                ephemeral=True,
+            )
+            return
+
+        embed = self._filter_embed(route_filter)
+        embed.title = f"Routing To #{channel.name}"
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @freegames.command(
+        description="Stop Posting Giveaways To An Extra Channel",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    @discord.default_permissions(manage_guild=True)
+    @discord.option(
+        "channel",
+        description="Routed Channel To Remove",
+        type=discord.TextChannel,
+    )
+    async def unroute(
+        self,
+        ctx: discord.ApplicationContext,
+        channel: discord.TextChannel,
+    ) -> None:
+        assert ctx.guild_id, "Guild-only Command"
+        if not await self.repo.remove_guild_route(ctx.guild_id, channel.id):
+            await ctx.respond(
+                f"{channel.mention} Has No Route Configured.", ephemeral=True
+            )
+            return
+
+        await ctx.respond(
+            f"Got It! {channel.mention} Will No Longer Receive Giveaways.",
+            ephemeral=True,
+        )
+
+    @freegames.command(
+        description="List The Extra Channels Giveaways Are Routed To",
+        integration_types={
+            discord.IntegrationType.guild_install,
+            discord.IntegrationType.user_install,
+        },
+    )
+    async def routes(self, ctx: discord.ApplicationContext) -> None:
+        if ctx.guild_id is None:
+            await ctx.respond(
+                "This Command Can Only Be Used In Servers.", ephemeral=True
+            )
+            return
+
+        routes = await self.repo.get_guild_routes(ctx.guild_id)
+        if not routes:
+            await ctx.respond(
+                "No Extra Channels Configured. Use /freegames route To Add One.",
+                ephemeral=True,
+            )
+            return
+
+        embed = discord.Embed(title="Giveaway Routes", color=discord.Color.blurple())
+        for route in routes[:25]:
+            channel = ctx.guild.get_channel(route.channel_id) if ctx.guild else None
+            described = route.filter.describe().items()
+            embed.add_field(
+                name=f"#{channel.name}" if channel else f"`{route.channel_id}`",
+                value="\n".join(f"{name} : {value}" for name, value in described),
+                inline=False,
+            )
+        await ctx.respond(embed=embed, ephemeral=True)
+
     @freegames.command(
         description="Show Where Giveaways Will Be Posted",
         integration_types={
@@ -103,10 +492,12 @@ class FreeGamesCog(commands.Cog):
 
         channel = ctx.guild.get_channel(channel_id) if ctx.guild else None
         mention = channel.mention if channel else f"`{channel_id}`"
-        guilds, notified = await self.repo.dump_state()
+        guilds, tracked = await self.repo.dump_state()
+        guild_cfg = await self.repo.get_guild(ctx.guild_id)
+        sends = guild_cfg.sends if guild_cfg else 0
 
         await ctx.respond(
-            f"Posting Giveaways To {mention}. Tracked Guilds : {guilds}, Sent Items : {notified}.",
+            f"Posting Giveaways To {mention}. Tracked Guilds : {guilds}, Tracked Giveaways : {tracked}, Messages Sent Here : {sends}.",
             ephemeral=True,
         )
 
@@ -157,7 +548,7 @@ class FreeGamesCog(commands.Cog):
         urls = [g.open_giveaway_url or None for g in giveaways]
 
         view = EmbedPaginator(embeds, user_id=ctx.user.id, urls=urls)
-        await ctx.respond(embed=embeds[0], view=view)
+        await ctx.respond(content=self._stale_notice(), embed=embeds[0], view=view)
         view.message = await ctx.interaction.original_response()
 
     @freegames.command(
@@ -176,11 +567,23 @@ class FreeGamesCog(commands.Cog):
         giveaway_id: int,
     ) -> None:
         await ctx.defer()
-        giveaway = await self.api.fetch_giveaway(giveaway_id)
+
+        giveaway = None
+        if await self._refresh_catalog():
+            giveaway = self.catalog.get(giveaway_id)
+
+        if giveaway is None:
+            try:
+                giveaway = await self.api.fetch_giveaway(giveaway_id, allow_stale=True)
+            except Exception:
+                log.exception("Failed To Fetch Giveaway %s", giveaway_id)
+                await ctx.respond("Could Not Reach GamerPower Right Now.")
+                return
+
         if not giveaway:
             await ctx.respond(f"No Giveaway Found For ID {giveaway_id}.")
             return
-        await ctx.respond(embed=giveaway_embed(giveaway))
+        await ctx.respond(content=self._stale_notice(), embed=giveaway_embed(giveaway))
 
     @freegames.command(
         description="Total Live Giveaways And Estimated Worth",
@@ -211,7 +614,17 @@ class FreeGamesCog(commands.Cog):
     ) -> None:
         await ctx.defer()
 
-        data = await self.api.fetch_worth(platform=platform, type_=type_)
+        if await self._refresh_catalog():
+            data = self.catalog.worth(platform=platform, type_=type_)
+        else:
+            try:
+                data = await self.api.fetch_worth(
+                    platform=platform, type_=type_, allow_stale=True
+                )
+            except Exception:
+                log.exception("Failed To Fetch Worth Summary")
+                await ctx.respond("Could Not Reach GamerPower Right Now.")
+                return
 
         if not data:
             await ctx.respond("Worth Endpoint Returned Nothing.")
@@ -241,7 +654,7 @@ class FreeGamesCog(commands.Cog):
             embed.add_field(name="Platform", value=platform, inline=True)
         if type_:
             embed.add_field(name="Type", value=type_, inline=True)
-        await ctx.respond(embed=embed)
+        await ctx.respond(content=self._stale_notice(), embed=embed)
 
     @freegames.command(
         description="Show Help For FreeGames Commands",
@@ -261,6 +674,41 @@ class FreeGamesCog(commands.Cog):
             value="Set the channel where giveaway notifications will be posted. Requires manage guild permission.",
             inline=False,
         )
+        embed.add_field(
+            name="/freegames packing <enabled>",
+            value="Group new giveaways into messages of up to 10 embeds. Requires manage guild permission.",
+            inline=False,
+        )
+        embed.add_field(
+            name="/freegames filter [platforms] [types] [min-worth] [include] [exclude]",
+            value="Only post giveaways matching these filters. Requires manage guild permission.",
+            inline=False,
+        )
+        embed.add_field(
+            name="/freegames filters",
+            value="Show this server's notification filters.",
+            inline=False,
+        )
+        embed.add_field(
+            name="/freegames clear-filters",
+            value="Remove all notification filters. Requires manage guild permission.",
+            inline=False,
+        )
+        embed.add_field(
+            name="/freegames route <channel> [filters]",
+            value="Also post giveaways matching the filters to another channel. Requires manage guild permission.",
+            inline=False,
+        )
+        embed.add_field(
+            name="/freegames unroute <channel> / routes",
+            value="Remove a routed channel, or list the configured routes.",
+            inline=False,
+        )
+        embed.add_field(
+            name="/freegames digest <interval>",
+            value="Post one summary of new giveaways hourly, every 6 hours or daily instead of one message each. Requires manage guild permission.",
+            inline=False,
+        )
         embed.add_field(
             name="/freegames status",
             value="Show the configured notification channel and stats.",
@@ -284,6 +732,33 @@ class FreeGamesCog(commands.Cog):
         embed.set_footer(text="Powered by GamerPower API")
         await ctx.respond(embed=embed)
 
+    async def _refresh_catalog(self) -> bool:
+        if self.catalog.is_fresh(settings.catalog_max_age_seconds):
+            return True
+
+        if len(self.catalog):
+            self._schedule_refresh()
+            return True
+
+        return await self._reload_catalog()
+
+    async def _reload_catalog(self) -> bool:
+        return await self.fetch_latest_giveaways() is not None
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._reload_catalog())
+
+    def _stale_notice(self) -> Optional[str]:
+        age = self.catalog.age_seconds()
+        if age is None or age <= settings.catalog_max_age_seconds:
+            return None
+
+        return (
+            f"Showing Cached Results From {int(age // 60)} Minutes Ago; "
+            "Refreshing In The Background."
+        )
+
     async def _fetch_giveaways(
         self,
         ctx: discord.ApplicationContext,
@@ -291,15 +766,11 @@ class FreeGamesCog(commands.Cog):
         type_: Optional[str],
         sort_by: Optional[str],
     ) -> List[Giveaway]:
-        try:
-            return await self.api.fetch_giveaways(
-                platform=platform, type_=type_, sort_by=sort_by
-            )
-        except Exception:
-            log.exception("Failed To Fetch Giveaways")
-            await ctx.respond("Could Not Reach GamerPower Right Now.", ephemeral=True)
+        if await self._refresh_catalog():
+            return self.catalog.query(platform=platform, type_=type_, sort_by=sort_by)
 
-            return []
+        await ctx.respond("Could Not Reach GamerPower Right Now.", ephemeral=True)
+        return []
 
     def _chunked_embeds(self, giveaways: List[Giveaway]) -> List[discord.Embed]:
         embeds = []
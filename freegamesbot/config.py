@@ -9,6 +9,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+SQLITE_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+SQLITE_TEMP_STORES = ("DEFAULT", "FILE", "MEMORY")
+
 DEFAULT_RSS_FEEDS = [
     "https://www.gamerpower.com/rss/giveaways",
     "https://www.gamerpower.com/rss/pc",
@@ -27,11 +30,45 @@ class Settings:
     discord_token: str
     db_path: str = "data/freegames.db"
     poll_interval_seconds: int = 900
+    poll_min_interval_seconds: int = 120
+    poll_max_interval_seconds: int = 1500
+    poll_jitter: float = 0.1
 
     gamerpower_base_url: str = "https://www.gamerpower.com/api"
     max_items_per_page: int = 6
 
+    api_cache_ttl_seconds: float = 60.0
+    api_cache_max_entries: int = 256
+    catalog_max_age_seconds: int = 1800
+
+    api_timeout_seconds: float = 15.0
+    api_max_retries: int = 2
+    api_breaker_threshold: int = 5
+    api_breaker_reset_seconds: float = 60.0
+
+    fanout_concurrency: int = 16
+    fanout_deadline_seconds: float = 600.0
+
+    send_global_rate: int = 45
+    send_channel_rate: int = 5
+    send_channel_per_seconds: float = 5.0
+    outbox_max_attempts: int = 5
+
+    channel_failure_limit: int = 5
+    channel_retry_base_seconds: float = 900.0
+    channel_retry_max_seconds: float = 86400.0
+
     rss_feeds: List[str] = field(default_factory=list)
+    rss_timeout_seconds: float = 15.0
+    rss_concurrency: int = 4
+
+    db_group_commit_seconds: float = 0.0
+    db_group_commit_max_writes: int = 256
+    db_read_connections: int = 2
+    db_synchronous: str = "NORMAL"
+    db_mmap_size: int = 268435456
+    db_cache_size: int = -16000
+    db_temp_store: str = "MEMORY"
     developer_user_id: Optional[int] = None
 
     @classmethod
@@ -39,17 +76,50 @@ class Settings:
         token = os.getenv("DISCORD_TOKEN", "").strip()
         db_path = os.getenv("DATABASE_PATH", "data/freegames.db").strip()
         poll_interval = int(os.getenv("POLL_INTERVAL_SECONDS", "900"))
+        poll_min = int(os.getenv("POLL_MIN_INTERVAL_SECONDS", "120"))
+        poll_max = int(os.getenv("POLL_MAX_INTERVAL_SECONDS", "1500"))
+        poll_jitter = float(os.getenv("POLL_JITTER", "0.1"))
 
         base_url = os.getenv(
             "GAMERPOWER_BASE_URL", "https://www.gamerpower.com/api"
         ).strip()
 
         page_size = int(os.getenv("MAX_ITEMS_PER_PAGE", "6"))
+        cache_ttl = float(os.getenv("API_CACHE_TTL_SECONDS", "60"))
+        cache_size = int(os.getenv("API_CACHE_MAX_ENTRIES", "256"))
+        catalog_max_age = int(os.getenv("CATALOG_MAX_AGE_SECONDS", "1800"))
+        poll_max = min(poll_max, int(catalog_max_age / (1 + max(0.0, poll_jitter))))
+        api_timeout = float(os.getenv("API_TIMEOUT_SECONDS", "15"))
+        api_retries = int(os.getenv("API_MAX_RETRIES", "2"))
+        breaker_threshold = int(os.getenv("API_BREAKER_THRESHOLD", "5"))
+        breaker_reset = float(os.getenv("API_BREAKER_RESET_SECONDS", "60"))
+        fanout_concurrency = int(os.getenv("FANOUT_CONCURRENCY", "16"))
+        fanout_deadline = float(os.getenv("FANOUT_DEADLINE_SECONDS", "600"))
+        send_global_rate = int(os.getenv("SEND_GLOBAL_RATE", "45"))
+        send_channel_rate = int(os.getenv("SEND_CHANNEL_RATE", "5"))
+        send_channel_per = float(os.getenv("SEND_CHANNEL_PER_SECONDS", "5"))
+        outbox_attempts = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+        channel_failures = int(os.getenv("CHANNEL_FAILURE_LIMIT", "5"))
+        channel_retry_base = float(os.getenv("CHANNEL_RETRY_BASE_SECONDS", "900"))
+        channel_retry_max = float(os.getenv("CHANNEL_RETRY_MAX_SECONDS", "86400"))
         feeds_raw = os.getenv("RSS_FEEDS", "").strip()
 
         feeds = [
             item.strip() for item in feeds_raw.split(",") if item.strip()
         ] or DEFAULT_RSS_FEEDS
+        rss_timeout = float(os.getenv("RSS_TIMEOUT_SECONDS", "15"))
+        rss_concurrency = int(os.getenv("RSS_CONCURRENCY", "4"))
+        group_commit = float(os.getenv("DB_GROUP_COMMIT_SECONDS", "0"))
+        group_commit_writes = int(os.getenv("DB_GROUP_COMMIT_MAX_WRITES", "256"))
+        read_connections = int(os.getenv("DB_READ_CONNECTIONS", "2"))
+        synchronous = os.getenv("DB_SYNCHRONOUS", "NORMAL").strip().upper()
+        if synchronous not in SQLITE_SYNCHRONOUS_MODES:
+            synchronous = "NORMAL"
+        mmap_size = int(os.getenv("DB_MMAP_SIZE", "268435456"))
+        cache_size = int(os.getenv("DB_CACHE_SIZE", "-16000"))
+        temp_store = os.getenv("DB_TEMP_STORE", "MEMORY").strip().upper()
+        if temp_store not in SQLITE_TEMP_STORES:
+            temp_store = "MEMORY"
 
         developer_id_raw = os.getenv("DEVELOPER_USER_ID", "").strip()
         developer_id = int(developer_id_raw) if developer_id_raw.isdigit() else None
@@ -58,9 +128,37 @@ class Settings:
             discord_token=token,
             db_path=db_path,
             poll_interval_seconds=poll_interval,
+            poll_min_interval_seconds=poll_min,
+            poll_max_interval_seconds=poll_max,
+            poll_jitter=poll_jitter,
             gamerpower_base_url=base_url,
             max_items_per_page=page_size,
+            api_cache_ttl_seconds=cache_ttl,
+            api_cache_max_entries=cache_size,
+            catalog_max_age_seconds=catalog_max_age,
+            api_timeout_seconds=api_timeout,
+            api_max_retries=api_retries,
+            api_breaker_threshold=breaker_threshold,
+            api_breaker_reset_seconds=breaker_reset,
+            fanout_concurrency=fanout_concurrency,
+            fanout_deadline_seconds=fanout_deadline,
+            send_global_rate=send_global_rate,
+            send_channel_rate=send_channel_rate,
+            send_channel_per_seconds=send_channel_per,
+            outbox_max_attempts=outbox_attempts,
+            channel_failure_limit=channel_failures,
+            channel_retry_base_seconds=channel_retry_base,
+            channel_retry_max_seconds=channel_retry_max,
             rss_feeds=feeds,
+            rss_timeout_seconds=rss_timeout,
+            rss_concurrency=rss_concurrency,
+            db_group_commit_seconds=group_commit,
+            db_group_commit_max_writes=group_commit_writes,
+            db_read_connections=read_connections,
+            db_synchronous=synchronous,
+            db_mmap_size=mmap_size,
+            db_cache_size=cache_size,
+            db_temp_store=temp_store,
             developer_user_id=developer_id,
         )
 
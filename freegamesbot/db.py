@@ -1,48 +1,309 @@
 from __future__ import annotations
 
 import os
+import json
+import time
 import asyncio
+import logging
 import aiosqlite
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from .filters import GuildFilter
 
-@dataclass
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class GuildSettings:
     guild_id: int
     channel_id: int
+    pack_embeds: bool = False
+    digest_seconds: int = 0
+    dormant: bool = False
+    sends: int = 0
+    failures: int = 0
+
+    @classmethod
+    def from_row(cls, row: Tuple) -> "GuildSettings":
+        return cls(
+            guild_id=row[0],
+            channel_id=row[1],
+            pack_embeds=bool(row[2]),
+            digest_seconds=row[3] or 0,
+            dormant=bool(row[4]),
+            sends=row[5] or 0,
+            failures=row[6] or 0,
+        )
+
+
+GUILD_COLUMNS = (
+    "guild_id, channel_id, pack_embeds, digest_seconds, dormant, sends, failures"
+)
+
+
+@dataclass
+class DeliveryStats:
+    tracked_giveaways: int = 0
+    sends: int = 0
+    failures: int = 0
+    day: str = ""
+    sends_today: int = 0
+    failures_today: int = 0
+
+    def today(self) -> Tuple[int, int]:
+        if self.day != _utc_day():
+            return 0, 0
+        return self.sends_today, self.failures_today
+
+
+def _utc_day() -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime())
+
+
+FILTER_COLUMNS = (
+    "platform_mask, types, min_worth_cents, include_keywords, exclude_keywords"
+)
+
+
+def _filter_params(guild_filter: GuildFilter) -> Tuple:
+    return (
+        guild_filter.platform_mask,
+        ",".join(sorted(guild_filter.types)),
+        guild_filter.min_worth_cents,
+        json.dumps(guild_filter.include),
+        json.dumps(guild_filter.exclude),
+    )
+
+
+def _filter_from_row(row: Tuple) -> GuildFilter:
+    return GuildFilter(
+        platform_mask=row[0],
+        types=frozenset(value for value in row[1].split(",") if value),
+        min_worth_cents=row[2],
+        include=tuple(json.loads(row[3])),
+        exclude=tuple(json.loads(row[4])),
+    )
+
+
+@dataclass
+class GuildRoute:
+    guild_id: int
+    channel_id: int
+    filter: GuildFilter
 
 
 class SettingsRepository:
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        group_commit_seconds: float = 0.0,
+        group_commit_max_writes: int = 256,
+        read_connections: int = 0,
+        pragmas: Optional[Dict[str, object]] = None,
+    ) -> None:
         self.db_path = db_path
+        self.read_connections = max(0, read_connections)
+        self.pragmas = dict(pragmas or {})
+        self.group_commit_seconds = group_commit_seconds
+        self.group_commit_max_writes = max(1, group_commit_max_writes)
 
         self._conn: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._next_reader = 0
         self._lock = asyncio.Lock()
 
+        self._pending_writes = 0
+        self._batch: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.routes_version = 0
+        self._routes: Optional[Dict[int, List[GuildRoute]]] = None
+        self._guilds: Dict[int, GuildSettings] = {}
+        self.stats = DeliveryStats()
+
     async def connect(self) -> None:
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
         self._conn = await aiosqlite.connect(self.db_path)
 
         await self._conn.execute("PRAGMA journal_mode=WAL;")
         await self._conn.execute("PRAGMA foreign_keys=ON;")
+        await self._apply_pragmas(self._conn)
         await self._create_schema()
+        await self._load_guilds()
+        await self._load_stats()
+
+        for _ in range(self.read_connections):
+            reader = await aiosqlite.connect(self.db_path)
+            await reader.execute("PRAGMA query_only=ON;")
+            await self._apply_pragmas(reader)
+            self._readers.append(reader)
+
+    async def _apply_pragmas(self, conn: aiosqlite.Connection) -> None:
+        for name, value in self.pragmas.items():
+            await conn.execute(f"PRAGMA {name}={value};")
 
     async def close(self) -> None:
+        for reader in self._readers:
+            await reader.close()
+        self._readers.clear()
+
         if self._conn:
+            await self.flush()
             await self._conn.close()
             self._conn = None
 
+    def _reader(self) -> aiosqlite.Connection:
+        assert self._conn
+
+        if not self._readers or self._batch is not None:
+            return self._conn
+
+        self._next_reader = (self._next_reader + 1) % len(self._readers)
+        return self._readers[self._next_reader]
+
+    async def _commit(self) -> None:
+        assert self._conn
+
+        if self.group_commit_seconds <= 0:
+            await self._conn.commit()
+            return
+
+        self._pending_writes += 1
+        if self._batch is None:
+            self._batch = asyncio.get_running_loop().create_future()
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+        if self._pending_writes >= self.group_commit_max_writes:
+            await self._flush_batch()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.group_commit_seconds)
+
+        try:
+            async with self._lock:
+                await self._flush_batch()
+        except Exception:
+            log.exception("Failed To Commit Write Batch")
+
+    async def _flush_batch(self) -> None:
+        assert self._conn
+
+        batch, self._batch = self._batch, None
+        self._pending_writes = 0
+        if batch is None:
+            return
+
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+        try:
+            await self._conn.commit()
+        except Exception as exc:
+            if not batch.done():
+                batch.set_exception(exc)
+                batch.exception()
+            raise
+
+        if not batch.done():
+            batch.set_result(None)
+
+    async def durable(self) -> None:
+        if self._batch is not None:
+            await asyncio.shield(self._batch)
+
+    async def flush(self) -> None:
+        async with self._lock:
+            await self._flush_batch()
+
     async def _create_schema(self) -> None:
         assert self._conn
         await self._conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS guild_settings (
                 guild_id INTEGER PRIMARY KEY,
-                channel_id INTEGER NOT NULL
+                channel_id INTEGER NOT NULL,
+                pack_embeds INTEGER NOT NULL DEFAULT 0,
+                dormant INTEGER NOT NULL DEFAULT 0,
+                digest_seconds INTEGER NOT NULL DEFAULT 0,
+                digest_next_at REAL
+            );
+
+            CREATE TABLE IF NOT EXISTS guild_filters (
+                guild_id INTEGER PRIMARY KEY,
+                platform_mask INTEGER NOT NULL DEFAULT 0,
+                types TEXT NOT NULL DEFAULT '',
+                min_worth_cents INTEGER,
+                include_keywords TEXT NOT NULL DEFAULT '[]',
+                exclude_keywords TEXT NOT NULL DEFAULT '[]',
+                FOREIGN KEY (guild_id) REFERENCES guild_settings(guild_id)
+                    ON DELETE CASCADE
+            );
+
+            CREATE TABLE IF NOT EXISTS guild_routes (
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                platform_mask INTEGER NOT NULL DEFAULT 0,
+                types TEXT NOT NULL DEFAULT '',
+                min_worth_cents INTEGER,
+                include_keywords TEXT NOT NULL DEFAULT '[]',
+                exclude_keywords TEXT NOT NULL DEFAULT '[]',
+                PRIMARY KEY (guild_id, channel_id),
+                FOREIGN KEY (guild_id) REFERENCES guild_settings(guild_id)
+                    ON DELETE CASCADE
+            );
+
+            CREATE TABLE IF NOT EXISTS giveaways_seen (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                giveaway_id TEXT NOT NULL UNIQUE
+            );
+
+            CREATE TABLE IF NOT EXISTS stats (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                day TEXT PRIMARY KEY,
+                sends INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TRIGGER IF NOT EXISTS giveaways_seen_insert
+            AFTER INSERT ON giveaways_seen BEGIN
+                UPDATE stats SET value = value + 1 WHERE key = 'tracked_giveaways';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS giveaways_seen_delete
+            AFTER DELETE ON giveaways_seen BEGIN
+                UPDATE stats SET value = value - 1 WHERE key = 'tracked_giveaways';
+            END;
+
+            CREATE TABLE IF NOT EXISTS outbox (
+                guild_id INTEGER NOT NULL,
+                giveaway_id TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (guild_id, giveaway_id),
+                FOREIGN KEY (guild_id) REFERENCES guild_settings(guild_id)
+                    ON DELETE CASCADE
             );
 
-            CREATE TABLE IF NOT EXISTS notified_giveaways (
+            CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, guild_id);
+
+            CREATE TABLE IF NOT EXISTS outbox_sent (
+                guild_id INTEGER NOT NULL,
+                giveaway_id TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, giveaway_id, channel_id),
+                FOREIGN KEY (guild_id, giveaway_id)
+                    REFERENCES outbox(guild_id, giveaway_id) ON DELETE CASCADE
+            );
+
+            CREATE TABLE IF NOT EXISTS digest_pending (
                 guild_id INTEGER NOT NULL,
                 giveaway_id TEXT NOT NULL,
                 PRIMARY KEY (guild_id, giveaway_id),
@@ -50,27 +311,363 @@ class SettingsRepository:
                     ON DELETE CASCADE
             );
 
+            CREATE TABLE IF NOT EXISTS poll_snapshot (
+                giveaway_id INTEGER PRIMARY KEY,
+                content_hash TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS catalog_snapshot (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                fetched_at REAL NOT NULL,
+                payload BLOB NOT NULL
+            );
+
             CREATE TABLE IF NOT EXISTS bot_state (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL
             );
             """
         )
+        await self._add_column(
+            "guild_settings", "pack_embeds", "INTEGER NOT NULL DEFAULT 0"
+        )
+        await self._add_column(
+            "guild_settings", "dormant", "INTEGER NOT NULL DEFAULT 0"
+        )
+        await self._add_column(
+            "guild_settings", "digest_seconds", "INTEGER NOT NULL DEFAULT 0"
+        )
+        await self._add_column("guild_settings", "digest_next_at", "REAL")
+        await self._add_column("guild_settings", "last_delivered_seq", "INTEGER")
+        await self._conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS guild_delivery
+            ON guild_settings (last_delivered_seq)
+            """
+        )
+        await self._add_column(
+            "guild_settings", "sends", "INTEGER NOT NULL DEFAULT 0"
+        )
+        await self._add_column(
+            "guild_settings", "failures", "INTEGER NOT NULL DEFAULT 0"
+        )
+        await self._migrate_notified()
+        await self._conn.execute(
+            """
+            INSERT INTO stats (key, value)
+            SELECT 'tracked_giveaways', (SELECT COUNT(*) FROM giveaways_seen)
+            WHERE NOT EXISTS (SELECT 1 FROM stats WHERE key = 'tracked_giveaways')
+            """
+        )
+        await self._conn.execute(
+            "INSERT OR IGNORE INTO stats (key, value) VALUES ('sends', 0), ('failures', 0)"
+        )
         await self._conn.commit()
 
+    async def _add_column(self, table: str, column: str, definition: str) -> None:
+        assert self._conn
+        cursor = await self._conn.execute(f"PRAGMA table_info({table})")
+        columns = {row[1] for row in await cursor.fetchall()}
+
+        await cursor.close()
+        if column not in columns:
+            await self._conn.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+            )
+
+    async def _migrate_notified(self) -> None:
+        assert self._conn
+        cursor = await self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='notified_giveaways'"
+        )
+        exists = await cursor.fetchone()
+
+        await cursor.close()
+        if not exists:
+            return
+
+        await self._conn.execute(
+            """
+            INSERT OR IGNORE INTO giveaways_seen (giveaway_id)
+            SELECT giveaway_id FROM (
+                SELECT giveaway_id FROM notified_giveaways
+                UNION SELECT CAST(giveaway_id AS TEXT) FROM poll_snapshot
+            )
+            ORDER BY CAST(giveaway_id AS INTEGER)
+            """
+        )
+        await self._conn.execute(
+            """
+            UPDATE guild_settings
+            SET last_delivered_seq = (SELECT MAX(seq) FROM giveaways_seen)
+            WHERE last_delivered_seq IS NULL AND guild_id IN (
+                SELECT DISTINCT guild_id FROM notified_giveaways
+            )
+            """
+        )
+        await self._conn.execute("DROP TABLE notified_giveaways")
+
+    async def _load_guilds(self) -> None:
+        assert self._conn
+        cursor = await self._conn.execute(f"SELECT {GUILD_COLUMNS} FROM guild_settings")
+        rows = await cursor.fetchall()
+
+        await cursor.close()
+        self._guilds = {row[0]: GuildSettings.from_row(row) for row in rows}
+
+    async def _load_stats(self) -> None:
+        assert self._conn
+        cursor = await self._conn.execute("SELECT key, value FROM stats")
+        values = dict(await cursor.fetchall())
+
+        await cursor.close()
+
+        day = _utc_day()
+        cursor = await self._conn.execute(
+            "SELECT sends, failures FROM daily_stats WHERE day=?", (day,)
+        )
+        row = await cursor.fetchone()
+
+        await cursor.close()
+        self.stats = DeliveryStats(
+            tracked_giveaways=values.get("tracked_giveaways", 0),
+            sends=values.get("sends", 0),
+            failures=values.get("failures", 0),
+            day=day,
+            sends_today=row[0] if row else 0,
+            failures_today=row[1] if row else 0,
+        )
+
+    async def _count_sends(self, guild_id: int, sends: int, failures: int) -> None:
+        assert self._conn
+
+        if not sends and not failures:
+            return
+
+        day = _utc_day()
+        await self._conn.execute(
+            """
+            UPDATE guild_settings SET sends=sends + ?, failures=failures + ?
+            WHERE guild_id=?
+            """,
+            (sends, failures, guild_id),
+        )
+        await self._conn.execute(
+            """
+            INSERT INTO daily_stats (day, sends, failures) VALUES (?, ?, ?)
+            ON CONFLICT(day) DO UPDATE SET
+                sends=sends + excluded.sends, failures=failures + excluded.failures
+            """,
+            (day, sends, failures),
+        )
+        await self._conn.executemany(
+            "UPDATE stats SET value=value + ? WHERE key=?",
+            [(sends, "sends"), (failures, "failures")],
+        )
+
+        record = self._guilds.get(guild_id)
+        if record is not None:
+            record.sends += sends
+            record.failures += failures
+
+        if self.stats.day != day:
+            self.stats.day = day
+            self.stats.sends_today = self.stats.failures_today = 0
+
+        self.stats.sends += sends
+        self.stats.failures += failures
+        self.stats.sends_today += sends
+        self.stats.failures_today += failures
+
+    async def record_failures(self, guild_id: int, count: int = 1) -> None:
+        assert self._conn
+        async with self._lock:
+            await self._count_sends(guild_id, 0, count)
+
+            await self._commit()
+
+    def _store_guild(self, row: Tuple) -> None:
+        record = GuildSettings.from_row(row)
+
+        if record.guild_id in self._guilds:
+            self._guilds[record.guild_id] = record
+        else:
+            self._guilds = {**self._guilds, record.guild_id: record}
+
+    def _drop_guild(self, guild_id: int) -> None:
+        if guild_id in self._guilds:
+            guilds = dict(self._guilds)
+            del guilds[guild_id]
+            self._guilds = guilds
+
     async def set_guild_channel(self, guild_id: int, channel_id: int) -> None:
         assert self._conn
         async with self._lock:
-            await self._conn.execute(
-                """
+            cursor = await self._conn.execute(
+                f"""
                 INSERT INTO guild_settings (guild_id, channel_id)
                 VALUES (?, ?)
-                ON CONFLICT(guild_id) DO UPDATE SET channel_id=excluded.channel_id
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    channel_id=excluded.channel_id, dormant=0
+                RETURNING {GUILD_COLUMNS}
                 """,
                 (guild_id, channel_id),
             )
+            row = await cursor.fetchone()
 
-            await self._conn.commit()
+            await cursor.close()
+            await self._commit()
+            self._store_guild(row)
+
+    async def set_guild_packing(self, guild_id: int, enabled: bool) -> bool:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                f"""
+                UPDATE guild_settings SET pack_embeds=? WHERE guild_id=?
+                RETURNING {GUILD_COLUMNS}
+                """,
+                (int(enabled), guild_id),
+            )
+            row = await cursor.fetchone()
+
+            await cursor.close()
+            await self._commit()
+            if row is not None:
+                self._store_guild(row)
+
+        return row is not None
+
+    async def set_guild_digest(
+        self, guild_id: int, seconds: int, next_at: Optional[float]
+    ) -> bool:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                f"""
+                UPDATE guild_settings SET digest_seconds=?, digest_next_at=?
+                WHERE guild_id=?
+                RETURNING {GUILD_COLUMNS}
+                """,
+                (seconds, next_at, guild_id),
+            )
+            row = await cursor.fetchone()
+
+            await cursor.close()
+            await self._commit()
+            if row is not None:
+                self._store_guild(row)
+
+        return row is not None
+
+    async def set_digest_next(self, guild_id: int, next_at: Optional[float]) -> None:
+        assert self._conn
+        async with self._lock:
+            await self._conn.execute(
+                "UPDATE guild_settings SET digest_next_at=? WHERE guild_id=?",
+                (next_at, guild_id),
+            )
+
+            await self._commit()
+
+    async def get_digest_schedule(self) -> List[Tuple[int, int, Optional[float]]]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            """
+            SELECT guild_id, digest_seconds, digest_next_at FROM guild_settings AS g
+            WHERE g.dormant = 0 AND (
+                g.digest_seconds > 0 OR EXISTS (
+                    SELECT 1 FROM digest_pending AS d WHERE d.guild_id = g.guild_id
+                )
+            )
+            """
+        )
+        rows = await cursor.fetchall()
+
+        await cursor.close()
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    async def defer_to_digest(self, guild_id: int, giveaway_ids: List[str]) -> None:
+        assert self._conn
+
+        if not giveaway_ids:
+            return
+
+        rows = [(guild_id, giveaway_id) for giveaway_id in giveaway_ids]
+
+        async with self._lock:
+            await self._conn.executemany(
+                "INSERT OR IGNORE INTO digest_pending (guild_id, giveaway_id) VALUES (?, ?)",
+                rows,
+            )
+            await self._conn.executemany(
+                "DELETE FROM outbox WHERE guild_id=? AND giveaway_id=?", rows
+            )
+
+            await self._commit()
+
+    async def get_digest_pending(self, guild_id: int) -> List[str]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            "SELECT giveaway_id FROM digest_pending WHERE guild_id=? ORDER BY rowid",
+            (guild_id,),
+        )
+        rows = await cursor.fetchall()
+
+        await cursor.close()
+        return [row[0] for row in rows]
+
+    async def clear_digest_pending(
+        self, guild_id: int, giveaway_ids: List[str], sends: int = 0
+    ) -> None:
+        assert self._conn
+
+        if not giveaway_ids:
+            return
+
+        async with self._lock:
+            await self._conn.executemany(
+                "DELETE FROM digest_pending WHERE guild_id=? AND giveaway_id=?",
+                [(guild_id, giveaway_id) for giveaway_id in giveaway_ids],
+            )
+            await self._count_sends(guild_id, sends, 0)
+
+            await self._commit()
+
+    async def set_guild_dormant(self, guild_id: int, dormant: bool) -> None:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                f"""
+                UPDATE guild_settings SET dormant=? WHERE guild_id=?
+                RETURNING {GUILD_COLUMNS}
+                """,
+                (int(dormant), guild_id),
+            )
+            rows = await cursor.fetchall()
+
+            await cursor.close()
+            await self._commit()
+            for row in rows:
+                self._store_guild(row)
+
+    async def set_channel_dormant(self, channel_id: int) -> List[int]:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                f"""
+                UPDATE guild_settings SET dormant=1 WHERE channel_id=?
+                RETURNING {GUILD_COLUMNS}
+                """,
+                (channel_id,),
+            )
+            rows = await cursor.fetchall()
+
+            await cursor.close()
+            await self._commit()
+            for row in rows:
+                self._store_guild(row)
+        return [row[0] for row in rows]
 
     async def clear_guild(self, guild_id: int) -> None:
         assert self._conn
@@ -79,65 +676,444 @@ class SettingsRepository:
                 "DELETE FROM guild_settings WHERE guild_id=?", (guild_id,)
             )
 
-            await self._conn.commit()
+            await self._commit()
+            self._drop_guild(guild_id)
+            self._invalidate_routes()
 
     async def get_guild_channel(self, guild_id: int) -> Optional[int]:
+        record = self._guilds.get(guild_id)
+        return record.channel_id if record else None
+
+    async def get_guilds(self, guild_ids: Iterable[int]) -> List[GuildSettings]:
+        records = (self._guilds.get(guild_id) for guild_id in guild_ids)
+        return [record for record in records if record and not record.dormant]
+
+    def iter_guilds(self) -> Iterator[GuildSettings]:
+        return (record for record in self._guilds.values() if not record.dormant)
+
+    def has_guilds(self) -> bool:
+        return any(not record.dormant for record in self._guilds.values())
+
+    async def set_guild_filter(self, guild_id: int, guild_filter: GuildFilter) -> bool:
         assert self._conn
-        cursor = await self._conn.execute(
-            "SELECT channel_id FROM guild_settings WHERE guild_id=?", (guild_id,)
+        async with self._lock:
+            cursor = await self._conn.execute(
+                f"""
+                INSERT INTO guild_filters (guild_id, {FILTER_COLUMNS})
+                SELECT guild_id, ?, ?, ?, ?, ? FROM guild_settings WHERE guild_id=?
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    platform_mask=excluded.platform_mask,
+                    types=excluded.types,
+                    min_worth_cents=excluded.min_worth_cents,
+                    include_keywords=excluded.include_keywords,
+                    exclude_keywords=excluded.exclude_keywords
+                """,
+                (*_filter_params(guild_filter), guild_id),
+            )
+            updated = cursor.rowcount > 0
+
+            await cursor.close()
+            await self._commit()
+
+        return updated
+
+    async def clear_guild_filter(self, guild_id: int) -> None:
+        assert self._conn
+        async with self._lock:
+            await self._conn.execute(
+                "DELETE FROM guild_filters WHERE guild_id=?", (guild_id,)
+            )
+
+            await self._commit()
+
+    async def get_guild_filters(self) -> Dict[int, GuildFilter]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            f"SELECT guild_id, {FILTER_COLUMNS} FROM guild_filters"
         )
+        rows = await cursor.fetchall()
 
-        row = await cursor.fetchone()
+        await cursor.close()
+        return {row[0]: _filter_from_row(row[1:]) for row in rows}
+
+    async def set_guild_route(self, route: GuildRoute) -> bool:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                f"""
+                INSERT INTO guild_routes (guild_id, channel_id, {FILTER_COLUMNS})
+                SELECT guild_id, ?, ?, ?, ?, ?, ? FROM guild_settings WHERE guild_id=?
+                ON CONFLICT(guild_id, channel_id) DO UPDATE SET
+                    platform_mask=excluded.platform_mask,
+                    types=excluded.types,
+                    min_worth_cents=excluded.min_worth_cents,
+                    include_keywords=excluded.include_keywords,
+                    exclude_keywords=excluded.exclude_keywords
+                """,
+                (route.channel_id, *_filter_params(route.filter), route.guild_id),
+            )
+            updated = cursor.rowcount > 0
+
+            await cursor.close()
+            await self._commit()
+            self._invalidate_routes()
+
+        return updated
+
+    async def remove_guild_route(self, guild_id: int, channel_id: int) -> bool:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                "DELETE FROM guild_routes WHERE guild_id=? AND channel_id=?",
+                (guild_id, channel_id),
+            )
+            removed = cursor.rowcount > 0
+
+            await cursor.close()
+            await self._commit()
+            self._invalidate_routes()
+
+        return removed
+
+    async def remove_channel_routes(self, channel_id: int) -> None:
+        assert self._conn
+        async with self._lock:
+            await self._conn.execute(
+                "DELETE FROM guild_routes WHERE channel_id=?", (channel_id,)
+            )
+
+            await self._commit()
+            self._invalidate_routes()
+
+    def _invalidate_routes(self) -> None:
+        self._routes = None
+        self.routes_version += 1
+
+    async def get_routes(self) -> Dict[int, List[GuildRoute]]:
+        assert self._conn
+        if self._routes is not None:
+            return self._routes
+
+        version = self.routes_version
+        cursor = await self._reader().execute(
+            f"SELECT guild_id, channel_id, {FILTER_COLUMNS} FROM guild_routes"
+        )
+        rows = await cursor.fetchall()
 
         await cursor.close()
-        return row[0] if row else None
 
-    async def get_all_guilds(self) -> List[GuildSettings]:
+        routes: Dict[int, List[GuildRoute]] = {}
+        for row in rows:
+            routes.setdefault(row[0], []).append(
+                GuildRoute(row[0], row[1], _filter_from_row(row[2:]))
+            )
+
+        if version == self.routes_version:
+            self._routes = routes
+        return routes
+
+    async def get_guild_routes(self, guild_id: int) -> List[GuildRoute]:
+        return (await self.get_routes()).get(guild_id, [])
+
+    async def record_seen(self, giveaway_ids: List[str]) -> Dict[str, int]:
         assert self._conn
-        cursor = await self._conn.execute(
-            "SELECT guild_id, channel_id FROM guild_settings"
+
+        if not giveaway_ids:
+            return {}
+
+        async with self._lock:
+            cursor = await self._conn.executemany(
+                "INSERT OR IGNORE INTO giveaways_seen (giveaway_id) VALUES (?)",
+                [(giveaway_id,) for giveaway_id in giveaway_ids],
+            )
+            self.stats.tracked_giveaways += max(0, cursor.rowcount)
+
+            await cursor.close()
+            cursor = await self._conn.execute(
+                """
+                SELECT giveaway_id, seq FROM giveaways_seen
+                WHERE giveaway_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(giveaway_ids),),
+            )
+            rows = await cursor.fetchall()
+
+            await cursor.close()
+            await self._commit()
+
+        return {row[0]: row[1] for row in rows}
+
+    async def prune_seen(self, min_seq: int) -> None:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                "DELETE FROM giveaways_seen WHERE seq < ?", (min_seq,)
+            )
+            self.stats.tracked_giveaways -= max(0, cursor.rowcount)
+
+            await cursor.close()
+            await self._commit()
+
+    async def get_lagging_guilds(self, max_seq: int) -> Dict[int, Optional[int]]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            """
+            SELECT guild_id, last_delivered_seq FROM guild_settings
+            WHERE dormant = 0
+                AND (last_delivered_seq IS NULL OR last_delivered_seq < ?)
+            """,
+            (max_seq,),
         )
         rows = await cursor.fetchall()
 
         await cursor.close()
-        return [GuildSettings(guild_id=row[0], channel_id=row[1]) for row in rows]
+        return {row[0]: row[1] for row in rows}
 
-    async def mark_notified(self, guild_id: int, giveaway_id: str) -> None:
+    async def has_lagging_guilds(self) -> bool:
+        assert self._conn
+        cursor = await self._reader().execute(
+            """
+            SELECT 1 FROM guild_settings
+            WHERE dormant = 0 AND (
+                last_delivered_seq IS NULL
+                OR last_delivered_seq < (SELECT MAX(seq) FROM giveaways_seen)
+            )
+            LIMIT 1
+            """
+        )
+        row = await cursor.fetchone()
+
+        await cursor.close()
+        return row is not None
+
+    async def mark_notified(
+        self, guild_id: int, giveaway_id: str, sends: int = 0
+    ) -> None:
         assert self._conn
         async with self._lock:
             await self._conn.execute(
-                "INSERT OR IGNORE INTO notified_giveaways (guild_id, giveaway_id) VALUES (?, ?)",
+                """
+                UPDATE guild_settings SET last_delivered_seq = MAX(
+                    COALESCE(last_delivered_seq, 0), seen.seq
+                )
+                FROM (SELECT seq FROM giveaways_seen WHERE giveaway_id=?) AS seen
+                WHERE guild_id=?
+                """,
+                (giveaway_id, guild_id),
+            )
+            await self._conn.execute(
+                "DELETE FROM outbox WHERE guild_id=? AND giveaway_id=?",
                 (guild_id, giveaway_id),
             )
+            await self._count_sends(guild_id, sends, 0)
 
-            await self._conn.commit()
+            await self._commit()
 
-    async def already_notified(self, guild_id: int, giveaway_id: str) -> bool:
+    async def enqueue_outbox(
+        self,
+        rows: List[Tuple[int, str]],
+        guild_ids: Iterable[int] = (),
+        seq: int = 0,
+    ) -> None:
         assert self._conn
-        cursor = await self._conn.execute(
-            "SELECT 1 FROM notified_giveaways WHERE guild_id=? AND giveaway_id=?",
-            (guild_id, giveaway_id),
+
+        advanced = list(guild_ids)
+        async with self._lock:
+            await self._conn.executemany(
+                "INSERT OR IGNORE INTO outbox (guild_id, giveaway_id) VALUES (?, ?)",
+                rows,
+            )
+            if advanced:
+                await self._conn.execute(
+                    """
+                    UPDATE guild_settings SET last_delivered_seq=?
+                    WHERE guild_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (seq, json.dumps(advanced)),
+                )
+
+            await self._commit()
+
+    async def get_outbox_guilds(self) -> List[GuildSettings]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            "SELECT DISTINCT guild_id FROM outbox WHERE status='pending'"
         )
-        row = await cursor.fetchone()
+        rows = await cursor.fetchall()
+
+        await cursor.close()
+        return await self.get_guilds(row[0] for row in rows)
+
+    async def claim_outbox(self, guild_id: int) -> List[str]:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                """
+                UPDATE outbox SET status='claimed'
+                WHERE guild_id=? AND status='pending'
+                RETURNING giveaway_id, rowid
+                """,
+                (guild_id,),
+            )
+            rows = await cursor.fetchall()
+
+            await cursor.close()
+            await self._commit()
+
+        return [row[0] for row in sorted(rows, key=lambda row: row[1])]
+
+    async def complete_outbox(
+        self,
+        guild_id: int,
+        giveaway_ids: List[str],
+        sends: int = 0,
+        failures: int = 0,
+    ) -> None:
+        assert self._conn
+
+        if not giveaway_ids and not sends and not failures:
+            return
+
+        rows = [(guild_id, giveaway_id) for giveaway_id in giveaway_ids]
+
+        async with self._lock:
+            await self._conn.executemany(
+                "DELETE FROM outbox WHERE guild_id=? AND giveaway_id=?", rows
+            )
+            await self._count_sends(guild_id, sends, failures)
+
+            await self._commit()
+
+    async def drop_outbox(self, guild_id: int, giveaway_ids: List[str]) -> None:
+        assert self._conn
+
+        if not giveaway_ids:
+            return
+
+        async with self._lock:
+            await self._conn.executemany(
+                "DELETE FROM outbox WHERE guild_id=? AND giveaway_id=?",
+                [(guild_id, giveaway_id) for giveaway_id in giveaway_ids],
+            )
+
+            await self._commit()
+
+    async def get_outbox_sent(self, guild_id: int) -> Set[Tuple[str, int]]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            "SELECT giveaway_id, channel_id FROM outbox_sent WHERE guild_id=?",
+            (guild_id,),
+        )
+        rows = await cursor.fetchall()
 
         await cursor.close()
-        return bool(row)
+        return {(row[0], row[1]) for row in rows}
 
-    async def prune_notified(self, guild_id: int, keep_ids: List[str]) -> None:
+    async def release_outbox(
+        self,
+        guild_id: int,
+        giveaway_ids: List[str],
+        max_attempts: int,
+        sent: Iterable[Tuple[str, int]] = (),
+    ) -> None:
         assert self._conn
 
-        if not keep_ids:
+        if not giveaway_ids:
             return
 
-        placeholders = ",".join("?" for _ in keep_ids)
+        async with self._lock:
+            await self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO outbox_sent (guild_id, giveaway_id, channel_id)
+                SELECT guild_id, giveaway_id, ? FROM outbox
+                WHERE guild_id=? AND giveaway_id=?
+                """,
+                [
+                    (channel_id, guild_id, giveaway_id)
+                    for giveaway_id, channel_id in sent
+                ],
+            )
+            await self._conn.executemany(
+                """
+                UPDATE outbox SET status='pending', attempts=attempts + 1
+                WHERE guild_id=? AND giveaway_id=?
+                """,
+                [(guild_id, giveaway_id) for giveaway_id in giveaway_ids],
+            )
+            await self._conn.execute(
+                "DELETE FROM outbox WHERE guild_id=? AND attempts >= ?",
+                (guild_id, max_attempts),
+            )
+
+            await self._commit()
+
+    async def reset_claimed_outbox(self) -> int:
+        assert self._conn
+        async with self._lock:
+            cursor = await self._conn.execute(
+                "UPDATE outbox SET status='pending' WHERE status='claimed'"
+            )
+            count = cursor.rowcount
+
+            await cursor.close()
+            await self._commit()
+
+        return count
+
+    async def get_poll_snapshot(self) -> Dict[int, str]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            "SELECT giveaway_id, content_hash FROM poll_snapshot"
+        )
+        rows = await cursor.fetchall()
+
+        await cursor.close()
+        return {row[0]: row[1] for row in rows}
+
+    async def update_poll_snapshot(
+        self, changed: Dict[int, str], removed: Iterable[int]
+    ) -> None:
+        assert self._conn
+        async with self._lock:
+            await self._conn.executemany(
+                "DELETE FROM poll_snapshot WHERE giveaway_id = ?",
+                [(giveaway_id,) for giveaway_id in removed],
+            )
+            await self._conn.executemany(
+                """
+                INSERT INTO poll_snapshot (giveaway_id, content_hash) VALUES (?, ?)
+                ON CONFLICT(giveaway_id) DO UPDATE SET
+                    content_hash = excluded.content_hash
+                """,
+                changed.items(),
+            )
+
+            await self._commit()
 
+    async def save_catalog_snapshot(self, payload: bytes, fetched_at: float) -> None:
+        assert self._conn
         async with self._lock:
             await self._conn.execute(
-                f"DELETE FROM notified_giveaways WHERE guild_id=? AND giveaway_id NOT IN ({placeholders})",
-                (guild_id, *keep_ids),
+                """
+                INSERT INTO catalog_snapshot (id, fetched_at, payload)
+                VALUES (1, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    fetched_at=excluded.fetched_at, payload=excluded.payload
+                """,
+                (fetched_at, payload),
             )
 
-            await self._conn.commit()
+            await self._commit()
+
+    async def load_catalog_snapshot(self) -> Optional[Tuple[bytes, float]]:
+        assert self._conn
+        cursor = await self._reader().execute(
+            "SELECT payload, fetched_at FROM catalog_snapshot WHERE id=1"
+        )
+        row = await cursor.fetchone()
+
+        await cursor.close()
+        return (row[0], row[1]) if row else None
 
     async def set_bot_state(self, key: str, value: str) -> None:
         assert self._conn
@@ -150,30 +1126,21 @@ class SettingsRepository:
                 """,
                 (key, value),
             )
-            await self._conn.commit()
+            await self._commit()
 
     async def get_bot_state(
         self, key: str, default: Optional[str] = None
     ) -> Optional[str]:
         assert self._conn
-        cursor = await self._conn.execute(
+        cursor = await self._reader().execute(
             "SELECT value FROM bot_state WHERE key=?", (key,)
         )
         row = await cursor.fetchone()
         await cursor.close()
         return row[0] if row else default
 
-    async def dump_state(self) -> Tuple[int, int]:
-        assert self._conn
-
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM guild_settings")
-        guilds = (await cursor.fetchone())[0]
+    async def get_guild(self, guild_id: int) -> Optional[GuildSettings]:
+        return self._guilds.get(guild_id)
 
-        await cursor.close()
-
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM notified_giveaways")
-        notified = (await cursor.fetchone())[0]
-
-        await cursor.close()
-
-        return guilds, notified
+    async def dump_state(self) -> Tuple[int, int]:
+        return len(self._guilds), self.stats.tracked_giveaways
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Set
+
+from .gamerpower import Giveaway
+
+
+@dataclass
+class SnapshotDiff:
+    added: Set[int] = field(default_factory=set)
+    removed: Set[int] = field(default_factory=set)
+    changed: Set[int] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def snapshot_digest(giveaways: Iterable[Giveaway]) -> Dict[int, str]:
+    return {giveaway.id: giveaway.content_hash() for giveaway in giveaways}
+
+
+def diff_snapshots(previous: Dict[int, str], current: Dict[int, str]) -> SnapshotDiff:
+    previous_ids = previous.keys()
+    current_ids = current.keys()
+
+    return SnapshotDiff(
+        added=set(current_ids - previous_ids),
+        removed=set(previous_ids - current_ids),
+        changed={
+            giveaway_id
+            for giveaway_id in current_ids & previous_ids
+            if current[giveaway_id] != previous[giveaway_id]
+        },
+    )
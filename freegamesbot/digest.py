@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import heapq
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+DIGEST_INTERVALS: Dict[str, int] = {
+    "Hourly": 3600,
+    "Every 6 Hours": 6 * 3600,
+    "Daily": 86400,
+}
+
+
+class DigestSchedule:
+    def __init__(self) -> None:
+        self.changed = asyncio.Event()
+
+        self._heap: List[Tuple[float, int]] = []
+        self._due: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def due_at(self, guild_id: int) -> Optional[float]:
+        return self._due.get(guild_id)
+
+    def schedule(self, guild_id: int, due_at: float) -> None:
+        self._due[guild_id] = due_at
+        heapq.heappush(self._heap, (due_at, guild_id))
+
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(due, gid) for gid, due in self._due.items()]
+            heapq.heapify(self._heap)
+
+        self.changed.set()
+
+    def cancel(self, guild_id: int) -> None:
+        self._due.pop(guild_id, None)
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            due_at, guild_id = self._heap[0]
+            if self._due.get(guild_id) == due_at:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[int]:
+        due: List[int] = []
+
+        self._discard_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, guild_id = heapq.heappop(self._heap)
+            del self._due[guild_id]
+            due.append(guild_id)
+            self._discard_stale()
+
+        return due
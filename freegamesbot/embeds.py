@@ -1,23 +1,18 @@
 from __future__ import annotations
 
-import datetime as dt
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import discord
 
 from .gamerpower import Giveaway
 
 
-def _format_discord_time(value: str | None) -> str:
-    if not value or value.lower() == "n/a":
-        return "Unknown"
+def _format_discord_time(timestamp: Optional[int], text: str = "") -> str:
+    if timestamp is None:
+        return text if text and text.lower() != "n/a" else "Unknown"
 
-    try:
-        parsed = dt.datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-        parsed = parsed.replace(tzinfo=dt.timezone.utc)
-        return f"<t:{int(parsed.timestamp())}:R>"
-
-    except Exception:
-        return value or "Unknown"
+    return f"<t:{timestamp}:R>"
 
 
 def giveaway_embed(giveaway: Giveaway) -> discord.Embed:
@@ -37,11 +32,13 @@ def giveaway_embed(giveaway: Giveaway) -> discord.Embed:
         name="Status", value=str(getattr(giveaway, "status", "?")), inline=True
     )
     embed.add_field(
-        name="Ends In", value=_format_discord_time(giveaway.end_date), inline=True
+        name="Ends In",
+        value=_format_discord_time(giveaway.end_ts, giveaway.end_date),
+        inline=True,
     )
     embed.add_field(
         name="Started",
-        value=_format_discord_time(giveaway.published_date),
+        value=_format_discord_time(giveaway.published_ts, giveaway.published_date),
         inline=True,
     )
     embed.add_field(
@@ -60,23 +57,166 @@ def giveaway_embed(giveaway: Giveaway) -> discord.Embed:
     return embed
 
 
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+MAX_BUTTONS_PER_ROW = 5
+MAX_DIGEST_PAGE_CHARS = 1800
+
+
+def claim_url(url: str) -> str:
+    if url.startswith("https://www.gamerpower.com/") and "/open/" not in url:
+        return url.replace(
+            "https://www.gamerpower.com/", "https://www.gamerpower.com/open/", 1
+        )
+    return url
+
+
 class GiveawayView(discord.ui.View):
     def __init__(self, url: str):
         super().__init__()
-        open_url = url
-        if url.startswith("https://www.gamerpower.com/") and "/open/" not in url:
-            open_url = url.replace(
-                "https://www.gamerpower.com/", "https://www.gamerpower.com/open/", 1
-            )
         self.add_item(
             discord.ui.Button(
                 label="Claim Giveaway",
                 style=discord.ButtonStyle.link,
-                url=open_url,
+                url=claim_url(url),
             )
         )
 
 
+class PackedGiveawayView(discord.ui.View):
+    def __init__(self, giveaways: List[Giveaway]):
+        super().__init__()
+        for index, giveaway in enumerate(giveaways):
+            self.add_item(
+                discord.ui.Button(
+                    label=f"Claim: {giveaway.title}"[:80],
+                    style=discord.ButtonStyle.link,
+                    url=claim_url(giveaway.open_giveaway_url),
+                    row=index // MAX_BUTTONS_PER_ROW,
+                )
+            )
+
+
+@dataclass
+class RenderedGiveaway:
+    content_hash: str
+    embed: discord.Embed
+    view: GiveawayView
+
+
+class RenderCache:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[int, RenderedGiveaway] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, giveaway: Giveaway) -> RenderedGiveaway:
+        content_hash = giveaway.content_hash()
+        rendered = self._entries.get(giveaway.id)
+
+        if rendered is not None and rendered.content_hash == content_hash:
+            self.hits += 1
+            return rendered
+
+        self.misses += 1
+        rendered = RenderedGiveaway(
+            content_hash=content_hash,
+            embed=giveaway_embed(giveaway),
+            view=GiveawayView(giveaway.open_giveaway_url),
+        )
+
+        self._entries[giveaway.id] = rendered
+        return rendered
+
+    def pack(self, giveaways: List[Giveaway]) -> List[List[Giveaway]]:
+        packs: List[List[Giveaway]] = []
+        current: List[Giveaway] = []
+        current_chars = 0
+
+        for giveaway in giveaways:
+            chars = len(self.render(giveaway).embed)
+            if current and (
+                len(current) >= MAX_EMBEDS_PER_MESSAGE
+                or current_chars + chars > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                packs.append(current)
+                current, current_chars = [], 0
+
+            current.append(giveaway)
+            current_chars += chars
+
+        if current:
+            packs.append(current)
+
+        return packs
+
+    def retain(self, giveaway_ids: Iterable[int]) -> None:
+        keep = set(giveaway_ids)
+        for giveaway_id in [key for key in self._entries if key not in keep]:
+            del self._entries[giveaway_id]
+
+
+def _digest_line(giveaway: Giveaway) -> str:
+    details = [giveaway.platforms or "Unknown", giveaway.worth]
+    if giveaway.end_ts is not None:
+        details.append(f"Ends {_format_discord_time(giveaway.end_ts)}")
+
+    title = giveaway.title.replace("[", "(").replace("]", ")")[:120]
+    return (
+        f"**[{title}]({claim_url(giveaway.open_giveaway_url)})**\n"
+        f"{' • '.join(details)}"
+    )
+
+
+def digest_messages(
+    giveaways: List[Giveaway],
+) -> List[Tuple[List[discord.Embed], List[int]]]:
+    pages: List[Tuple[List[str], List[int]]] = []
+    current: List[str] = []
+    current_ids: List[int] = []
+    current_chars = 0
+
+    for giveaway in giveaways:
+        line = _digest_line(giveaway)
+        if current and current_chars + len(line) > MAX_DIGEST_PAGE_CHARS:
+            pages.append((current, current_ids))
+            current, current_ids, current_chars = [], [], 0
+
+        current.append(line)
+        current_ids.append(giveaway.id)
+        current_chars += len(line) + 2
+
+    if current:
+        pages.append((current, current_ids))
+
+    messages: List[Tuple[List[discord.Embed], List[int]]] = []
+    message_chars = 0
+    for number, (lines, ids) in enumerate(pages, start=1):
+        embed = discord.Embed(
+            title=f"Giveaway Digest : {len(giveaways)} New",
+            description="\n\n".join(lines),
+            color=discord.Color.blurple(),
+        )
+        embed.set_footer(text=f"Page {number}/{len(pages)} • Powered By GamerPower")
+
+        chars = len(embed)
+        if not messages or (
+            len(messages[-1][0]) >= MAX_EMBEDS_PER_MESSAGE
+            or message_chars + chars > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            messages.append(([], []))
+            message_chars = 0
+
+        messages[-1][0].append(embed)
+        messages[-1][1].extend(ids)
+        message_chars += chars
+
+    return messages
+
+
 class RssView(discord.ui.View):
     def __init__(self, url: str):
         super().__init__()
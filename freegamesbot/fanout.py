@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class FanoutReport:
+    completed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    duration: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.completed} Completed, {self.skipped} Skipped, "
+            f"{self.failed} Failed, {self.timed_out} Timed Out "
+            f"In {self.duration:.1f}s"
+        )
+
+
+async def fan_out(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[bool]],
+    *,
+    concurrency: int,
+    deadline_seconds: float,
+) -> FanoutReport:
+    report = FanoutReport()
+    queue = iter(items)
+    started = time.monotonic()
+
+    async def run() -> None:
+        for item in queue:
+            try:
+                handled = await worker(item)
+            except asyncio.CancelledError:
+                report.timed_out += 1
+                raise
+            except Exception:
+                report.failed += 1
+                log.exception("Fan-Out Failed For %r", item)
+            else:
+                if handled:
+                    report.completed += 1
+                else:
+                    report.skipped += 1
+
+    workers = [asyncio.create_task(run()) for _ in range(max(1, concurrency))]
+    _, pending = await asyncio.wait(workers, timeout=deadline_seconds)
+
+    for task in pending:
+        task.cancel()
+
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        report.timed_out += sum(1 for _ in queue)
+        log.warning("Fan-Out Deadline Of %ss Reached", deadline_seconds)
+
+    report.duration = time.monotonic() - started
+    return report
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from .gamerpower import PLATFORMS, Giveaway, GiveawayType, platform_names
+
+
+@dataclass(frozen=True)
+class GuildFilter:
+    platform_mask: int = 0
+    types: FrozenSet[str] = frozenset()
+    min_worth_cents: Optional[int] = None
+    include: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.platform_mask
+            or self.types
+            or self.min_worth_cents
+            or self.include
+            or self.exclude
+        )
+
+    @property
+    def has_residual(self) -> bool:
+        return bool(self.min_worth_cents or self.include or self.exclude)
+
+    def matches(self, giveaway: Giveaway) -> bool:
+        if self.platform_mask and not giveaway.platform_mask & self.platform_mask:
+            return False
+
+        if self.types and giveaway.kind.value not in self.types:
+            return False
+
+        return self.matches_residual(giveaway)
+
+    def matches_residual(self, giveaway: Giveaway) -> bool:
+        if self.min_worth_cents and (giveaway.worth_cents or 0) < self.min_worth_cents:
+            return False
+
+        title = giveaway.title.lower()
+        if self.include and not any(word in title for word in self.include):
+            return False
+
+        return not any(word in title for word in self.exclude)
+
+    def describe(self) -> Dict[str, str]:
+        return {
+            "Platforms": ", ".join(platform_names(self.platform_mask)) or "Any",
+            "Types": ", ".join(
+                GiveawayType(value).label or value.title()
+                for value in sorted(self.types)
+            )
+            or "Any",
+            "Minimum Worth": (
+                f"${self.min_worth_cents / 100:.2f}" if self.min_worth_cents else "None"
+            ),
+            "Include Keywords": ", ".join(self.include) or "None",
+            "Exclude Keywords": ", ".join(self.exclude) or "None",
+        }
+
+
+def parse_keywords(value: str) -> Tuple[str, ...]:
+    return tuple(
+        dict.fromkeys(
+            word.strip().lower() for word in value.split(",") if word.strip()
+        )
+    )
+
+
+@dataclass
+class FilterIndex:
+    filters: Dict[int, GuildFilter] = field(default_factory=dict)
+
+    any_platform: Set[int] = field(default_factory=set)
+    by_platform: Dict[int, Set[int]] = field(default_factory=dict)
+    any_type: Set[int] = field(default_factory=set)
+    by_type: Dict[str, Set[int]] = field(default_factory=dict)
+    residual: Set[int] = field(default_factory=set)
+
+    def get(self, guild_id: int) -> GuildFilter:
+        return self.filters.get(guild_id) or GuildFilter()
+
+    def update(self, guild_id: int, guild_filter: Optional[GuildFilter]) -> None:
+        self.discard(guild_id)
+        if guild_filter is None:
+            return
+
+        self.filters[guild_id] = guild_filter
+
+        if guild_filter.platform_mask:
+            for bit in range(len(PLATFORMS)):
+                if guild_filter.platform_mask >> bit & 1:
+                    self.by_platform.setdefault(bit, set()).add(guild_id)
+        else:
+            self.any_platform.add(guild_id)
+
+        if guild_filter.types:
+            for value in guild_filter.types:
+                self.by_type.setdefault(value, set()).add(guild_id)
+        else:
+            self.any_type.add(guild_id)
+
+        if guild_filter.has_residual:
+            self.residual.add(guild_id)
+
+    def discard(self, guild_id: int) -> None:
+        guild_filter = self.filters.pop(guild_id, None)
+        if guild_filter is None:
+            return
+
+        self.any_platform.discard(guild_id)
+        self.any_type.discard(guild_id)
+        self.residual.discard(guild_id)
+
+        for bit in range(len(PLATFORMS)):
+            if guild_filter.platform_mask >> bit & 1:
+                self.by_platform.get(bit, set()).discard(guild_id)
+
+        for value in guild_filter.types:
+            self.by_type.get(value, set()).discard(guild_id)
+
+    def unfiltered(self, guild_ids: Iterable[int]) -> Set[int]:
+        return {gid for gid in guild_ids if gid not in self.filters}
+
+    def route(self, giveaway: Giveaway) -> Set[int]:
+        platform_match = set(self.any_platform)
+        for bit in range(len(PLATFORMS)):
+            if giveaway.platform_mask >> bit & 1:
+                platform_match |= self.by_platform.get(bit, set())
+
+        type_match = self.any_type | self.by_type.get(giveaway.kind.value, set())
+        small, large = sorted((platform_match, type_match), key=len)
+        matched = {gid for gid in small if gid in large}
+
+        return {
+            gid
+            for gid in matched
+            if gid not in self.residual
+            or self.filters[gid].matches_residual(giveaway)
+        }
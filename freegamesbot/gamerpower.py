@@ -1,61 +1,598 @@
 from __future__ import annotations
 
+import sys
+import enum
+import random
+import hashlib
+import functools
+import time
+import asyncio
+import datetime as dt
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 import httpx
 
 
-@dataclass
+PLATFORMS: Tuple[Tuple[str, str], ...] = (
+    ("pc", "PC"),
+    ("steam", "Steam"),
+    ("epic-games-store", "Epic Games Store"),
+    ("gog", "GOG"),
+    ("origin", "Origin"),
+    ("ubisoft", "Ubisoft"),
+    ("itchio", "Itch.io"),
+    ("drm-free", "DRM-Free"),
+    ("battlenet", "Battle.net"),
+    ("android", "Android"),
+    ("ios", "iOS"),
+    ("ps4", "Playstation 4"),
+    ("ps5", "Playstation 5"),
+    ("xbox-one", "Xbox One"),
+    ("xbox-series-xs", "Xbox Series X|S"),
+    ("xbox-360", "Xbox 360"),
+    ("switch", "Nintendo Switch"),
+    ("vr", "VR"),
+)
+
+PLATFORM_BITS: Dict[str, int] = {
+    slug: 1 << index for index, (slug, _) in enumerate(PLATFORMS)
+}
+_PLATFORM_NAME_BITS: Dict[str, int] = {
+    name.lower(): 1 << index for index, (_, name) in enumerate(PLATFORMS)
+}
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class GiveawayType(enum.Enum):
+    GAME = "game"
+    LOOT = "loot"
+    BETA = "beta"
+    OTHER = "other"
+
+    @property
+    def label(self) -> str:
+        return _TYPE_LABELS[self]
+
+    @classmethod
+    def parse(cls, value: str | None) -> "GiveawayType":
+        return _TYPE_ALIASES.get((value or "").strip().lower(), cls.OTHER)
+
+
+_TYPE_LABELS = {
+    GiveawayType.GAME: "Game",
+    GiveawayType.LOOT: "DLC",
+    GiveawayType.BETA: "Early Access",
+    GiveawayType.OTHER: "",
+}
+_TYPE_ALIASES = {
+    "game": GiveawayType.GAME,
+    "full game": GiveawayType.GAME,
+    "dlc": GiveawayType.LOOT,
+    "loot": GiveawayType.LOOT,
+    "early access": GiveawayType.BETA,
+    "beta": GiveawayType.BETA,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def platform_mask(value: str | None) -> Tuple[int, Optional[str]]:
+    mask = 0
+    unknown: List[str] = []
+
+    for name in (value or "").split(","):
+        name = name.strip()
+        if not name:
+            continue
+
+        bit = _PLATFORM_NAME_BITS.get(name.lower()) or PLATFORM_BITS.get(name.lower())
+        if bit:
+            mask |= bit
+        else:
+            unknown.append(name)
+
+    return mask, ", ".join(unknown) or None
+
+
+def platform_names(mask: int) -> List[str]:
+    return [name for index, (_, name) in enumerate(PLATFORMS) if mask >> index & 1]
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_epoch(value: str | None) -> Optional[int]:
+    if not value or value.strip().lower() == "n/a":
+        return None
+
+    try:
+        parsed = dt.datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _unparsed_date(value: str | None, timestamp: Optional[int]) -> Optional[str]:
+    if timestamp is not None or not value or value.strip().lower() == "n/a":
+        return None
+    return value
+
+
+def parse_worth_cents(value: str | None) -> Optional[int]:
+    if not value:
+        return None
+
+    try:
+        return round(float(value.replace("$", "").replace(",", "").strip()) * 100)
+    except ValueError:
+        return None
+
+
 class Giveaway:
-    id: int
-    title: str
-    worth: str
-    description: str
-    instructions: str
-    open_giveaway_url: str
-    image: str
-    thumbnail: str
-    platforms: str
-    type: str
-    published_date: str
-    end_date: str
-    users: int
-    status: str
+    _fields = (
+        "id",
+        "title",
+        "description",
+        "instructions",
+        "open_giveaway_url",
+        "image",
+        "thumbnail",
+        "users",
+        "status",
+        "worth_cents",
+        "platform_mask",
+        "kind",
+        "published_ts",
+        "end_ts",
+        "_extra_platforms",
+        "_type_label",
+        "_published_text",
+        "_end_text",
+    )
+    _hashed_fields = tuple(name for name in _fields if name != "users")
+    __slots__ = _fields + ("_content_hash",)
+
+    def __init__(
+        self,
+        id: int,
+        title: str = "",
+        description: str = "",
+        instructions: str = "",
+        open_giveaway_url: str = "",
+        image: str = "",
+        thumbnail: str = "",
+        users: int = 0,
+        status: str = "",
+        worth_cents: Optional[int] = None,
+        platform_mask: int = 0,
+        kind: GiveawayType = GiveawayType.OTHER,
+        published_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+        extra_platforms: Optional[str] = None,
+        type_label: Optional[str] = None,
+        published_text: Optional[str] = None,
+        end_text: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.description = description
+        self.instructions = instructions
+        self.open_giveaway_url = open_giveaway_url
+        self.image = image
+        self.thumbnail = thumbnail
+        self.users = users
+        self.status = status
+        self.worth_cents = worth_cents
+        self.platform_mask = platform_mask
+        self.kind = kind
+        self.published_ts = published_ts
+        self.end_ts = end_ts
+        self._extra_platforms = extra_platforms
+        self._type_label = type_label
+        self._published_text = published_text
+        self._end_text = end_text
+        self._content_hash: Optional[str] = None
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> "Giveaway":
+        mask, extra_platforms = platform_mask(data.get("platforms"))
+        raw_type = data.get("type") or ""
+        kind = GiveawayType.parse(raw_type)
+        published = data.get("published_date")
+        end = data.get("end_date")
+        published_ts = parse_epoch(published)
+        end_ts = parse_epoch(end)
+
         return cls(
             id=int(data.get("id")),
             title=data.get("title", ""),
-            worth=data.get("worth", ""),
             description=data.get("description", ""),
             instructions=data.get("instructions", ""),
             open_giveaway_url=data.get("open_giveaway_url", ""),
             image=data.get("image", ""),
             thumbnail=data.get("thumbnail", ""),
-            platforms=data.get("platforms", ""),
-            type=data.get("type", ""),
-            published_date=data.get("published_date", ""),
-            end_date=data.get("end_date", ""),
             users=int(data.get("users", 0) or 0),
-            status=data.get("status", ""),
+            status=sys.intern(data.get("status", "") or ""),
+            worth_cents=parse_worth_cents(data.get("worth")),
+            platform_mask=mask,
+            kind=kind,
+            published_ts=published_ts,
+            end_ts=end_ts,
+            extra_platforms=extra_platforms,
+            type_label=raw_type if raw_type != kind.label else None,
+            published_text=_unparsed_date(published, published_ts),
+            end_text=_unparsed_date(end, end_ts),
+        )
+
+    def to_row(self) -> List[Any]:
+        row: List[Any] = [getattr(self, name) for name in self._fields]
+        row[self._fields.index("kind")] = self.kind.value
+        return row
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> "Giveaway":
+        values = dict(zip(cls._fields, row))
+        values["kind"] = GiveawayType(values["kind"])
+        values["extra_platforms"] = values.pop("_extra_platforms")
+        values["type_label"] = values.pop("_type_label")
+        values["published_text"] = values.pop("_published_text", None)
+        values["end_text"] = values.pop("_end_text", None)
+        return cls(**values)
+
+    @property
+    def worth(self) -> str:
+        if self.worth_cents is None:
+            return "N/A"
+        return f"${self.worth_cents / 100:.2f}"
+
+    @property
+    def platforms(self) -> str:
+        names = platform_names(self.platform_mask)
+        if self._extra_platforms:
+            names.append(self._extra_platforms)
+        return ", ".join(names)
+
+    @property
+    def type(self) -> str:
+        return self._type_label or self.kind.label
+
+    @property
+    def published_date(self) -> str:
+        return self._published_text or _format_epoch(self.published_ts)
+
+    @property
+    def end_date(self) -> str:
+        return self._end_text or _format_epoch(self.end_ts)
+
+    def content_hash(self) -> str:
+        if self._content_hash is None:
+            payload = "\x1f".join(
+                str(getattr(self, name)) for name in self._hashed_fields
+            )
+            self._content_hash = hashlib.blake2b(
+                payload.encode(), digest_size=8
+            ).hexdigest()
+        return self._content_hash
+
+    def has_platform(self, slug: str) -> bool:
+        return bool(self.platform_mask & PLATFORM_BITS.get(slug, 0))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Giveaway):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self._fields
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Giveaway(id={self.id!r}, title={self.title!r}, type={self.type!r})"
+
+
+def _format_epoch(value: Optional[int]) -> str:
+    if value is None:
+        return "N/A"
+    return dt.datetime.fromtimestamp(value, dt.timezone.utc).strftime(_DATE_FORMAT)
+
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    coalesced: int = 0
+    stale: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ResponseCache:
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> CacheKey:
+        normalized = tuple(
+            sorted(
+                (str(name).lower(), str(value).strip().lower())
+                for name, value in params.items()
+                if value is not None and value != ""
+            )
         )
+        return endpoint, normalized
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.monotonic() - entry.fetched_at < self.ttl_seconds
+
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@dataclass
+class BreakerStats:
+    opened: int = 0
+    half_opened: int = 0
+    closed: int = 0
+    rejected: int = 0
+    retries: int = 0
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60.0) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.stats = BreakerStats()
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def before_request(self) -> None:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_seconds:
+                self.stats.rejected += 1
+                raise CircuitOpenError("GamerPower Circuit Is Open")
+
+            self.state = self.HALF_OPEN
+            self.stats.half_opened += 1
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self.stats.rejected += 1
+                raise CircuitOpenError("GamerPower Circuit Is Half-Open")
+            self._probing = True
+
+    def record_success(self) -> None:
+        self._probing = False
+        self.failures = 0
+
+        if self.state != self.CLOSED:
+            self.state = self.CLOSED
+            self.stats.closed += 1
+
+    def record_failure(self) -> None:
+        self._probing = False
+        self.failures += 1
+
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.stats.opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
 
 
 class GamerPowerClient:
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        cache_ttl_seconds: float = 60.0,
+        cache_max_entries: int = 256,
+        timeout_seconds: float = 15.0,
+        max_retries: int = 2,
+        retry_base_seconds: float = 0.5,
+        retry_cap_seconds: float = 5.0,
+        breaker_threshold: int = 5,
+        breaker_reset_seconds: float = 60.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=15.0)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url, timeout=timeout_seconds, transport=transport
+        )
+        self.cache = ResponseCache(
+            ttl_seconds=cache_ttl_seconds, max_entries=cache_max_entries
+        )
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset_seconds)
+
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_cap_seconds = retry_cap_seconds
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
 
     async def close(self) -> None:
         await self._client.aclose()
 
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        parse: Callable[[Any], Any],
+        *,
+        missing_ok: bool = False,
+        allow_stale: bool = False,
+    ) -> Any:
+        key = self.cache.make_key(endpoint, params)
+        entry = self.cache.get(key)
+
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.stats.hits += 1
+            return entry.value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch(key, entry, endpoint, params, parse, missing_ok)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release_inflight(key, done))
+        else:
+            self.cache.stats.coalesced += 1
+
+        try:
+            return await asyncio.shield(task)
+        except (httpx.HTTPError, CircuitOpenError):
+            if not allow_stale or entry is None:
+                raise
+
+            self.cache.stats.stale += 1
+            return entry.value
+
+    async def _request(
+        self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]
+    ) -> httpx.Response:
+        self.breaker.before_request()
+
+        try:
+            response = await self._send_with_retries(endpoint, params, headers)
+        except BaseException:
+            self.breaker.record_failure()
+            raise
+
+        if response.status_code < 500 and response.status_code != 429:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return response
+
+    async def _send_with_retries(
+        self, endpoint: str, params: Dict[str, Any], headers: Dict[str, str]
+    ) -> httpx.Response:
+        delay = self.retry_base_seconds
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.breaker.stats.retries += 1
+                delay = min(
+                    self.retry_cap_seconds,
+                    random.uniform(self.retry_base_seconds, delay * 3),
+                )
+                await asyncio.sleep(delay)
+
+            try:
+                response = await self._client.get(
+                    endpoint, params=params, headers=headers
+                )
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+                continue
+
+            if response.status_code < 500 and response.status_code != 429:
+                return response
+
+        return response
+
+    def _release_inflight(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        key: Hashable,
+        entry: Optional[CacheEntry],
+        endpoint: str,
+        params: Dict[str, Any],
+        parse: Callable[[Any], Any],
+        missing_ok: bool,
+    ) -> Any:
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self._request(endpoint, params, headers)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats.revalidated += 1
+            entry.fetched_at = time.monotonic()
+            return entry.value
+
+        self.cache.stats.misses += 1
+
+        if missing_ok and response.status_code == 404:
+            value = None
+        else:
+            response.raise_for_status()
+            value = parse(response.json())
+
+        self.cache.put(
+            key,
+            CacheEntry(
+                value=value,
+                fetched_at=time.monotonic(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            ),
+        )
+        return value
+
     async def fetch_giveaways(
         self,
         platform: Optional[str] = None,
         type_: Optional[str] = None,
         sort_by: Optional[str] = None,
+        *,
+        allow_stale: bool = False,
     ) -> List[Giveaway]:
         params: Dict[str, Any] = {}
 
@@ -68,35 +605,28 @@ class GamerPowerClient:
         if sort_by:
             params["sort-by"] = sort_by
 
-        response = await self._client.get("/giveaways", params=params)
-
-        response.raise_for_status()
-        data = response.json()
-
-        if isinstance(data, dict) and data.get("status") == 201:
-            return []
-
-        if not isinstance(data, list):
-            return []
-
-        return [Giveaway.from_json(item) for item in data]
-
-    async def fetch_giveaway(self, giveaway_id: int) -> Optional[Giveaway]:
-        response = await self._client.get("/giveaway", params={"id": giveaway_id})
-
-        if response.status_code == 404:
-            return None
-
-        response.raise_for_status()
-        data = response.json()
-
-        if not isinstance(data, dict):
-            return None
+        giveaways = await self._cached_get(
+            "/giveaways", params, self._parse_giveaways, allow_stale=allow_stale
+        )
+        return list(giveaways)
 
-        return Giveaway.from_json(data)
+    async def fetch_giveaway(
+        self, giveaway_id: int, *, allow_stale: bool = False
+    ) -> Optional[Giveaway]:
+        return await self._cached_get(
+            "/giveaway",
+            {"id": giveaway_id},
+            self._parse_giveaway,
+            missing_ok=True,
+            allow_stale=allow_stale,
+        )
 
     async def fetch_worth(
-        self, platform: Optional[str] = None, type_: Optional[str] = None
+        self,
+        platform: Optional[str] = None,
+        type_: Optional[str] = None,
+        *,
+        allow_stale: bool = False,
     ) -> Optional[Dict[str, Any]]:
         params: Dict[str, Any] = {}
         if platform:
@@ -105,14 +635,33 @@ class GamerPowerClient:
         if type_:
             params["type"] = type_
 
-        response = await self._client.get("/worth", params=params)
+        return await self._cached_get(
+            "/worth",
+            params,
+            self._parse_worth,
+            missing_ok=True,
+            allow_stale=allow_stale,
+        )
 
-        if response.status_code == 404:
+    @staticmethod
+    def _parse_giveaways(data: Any) -> List[Giveaway]:
+        if isinstance(data, dict) and data.get("status") == 201:
+            return []
+
+        if not isinstance(data, list):
+            return []
+
+        return [Giveaway.from_json(item) for item in data]
+
+    @staticmethod
+    def _parse_giveaway(data: Any) -> Optional[Giveaway]:
+        if not isinstance(data, dict):
             return None
 
-        response.raise_for_status()
-        data = response.json()
+        return Giveaway.from_json(data)
 
+    @staticmethod
+    def _parse_worth(data: Any) -> Optional[Dict[str, Any]]:
         if isinstance(data, dict) and "data" in data:
             data = data["data"]
 
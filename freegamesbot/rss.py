@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import re
+import html
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+
+import httpx
+
+from .catalog import GiveawayCatalog
+from .embeds import claim_url
+from .gamerpower import Giveaway, GiveawayType, platform_mask
+
+log = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_IMG_RE = re.compile(r"<img[^>]+src=[\"']([^\"']+)", re.IGNORECASE)
+_ID_RE = re.compile(r"[?&]id=(\d+)")
+_TITLE_PLATFORM_RE = re.compile(r"\(([^()]+)\)\s*(?:giveaway)?\s*$", re.IGNORECASE)
+
+_FEED_KINDS = {
+    "games": GiveawayType.GAME,
+    "loot": GiveawayType.LOOT,
+}
+
+
+def url_key(url: str) -> str:
+    path = urlsplit(url).path.strip("/")
+    if path.startswith("open/"):
+        path = path[len("open/") :]
+    return path.lower()
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _entry_id(guid: str, link: str, key: str) -> int:
+    if guid.isdigit():
+        return int(guid)
+
+    match = _ID_RE.search(guid) or _ID_RE.search(link)
+    if match:
+        return int(match.group(1))
+
+    digest = hashlib.blake2b(key.encode(), digest_size=6).digest()
+    return -int.from_bytes(digest, "big")
+
+
+def _parse_pub_date(value: str) -> Optional[int]:
+    try:
+        return int(parsedate_to_datetime(value).timestamp())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def normalize_item(
+    item: ElementTree.Element, kind: GiveawayType = GiveawayType.OTHER
+) -> Optional[Giveaway]:
+    fields: Dict[str, str] = {}
+    categories: List[str] = []
+    image = ""
+
+    for child in item:
+        name = _local(child.tag)
+        text = (child.text or "").strip()
+
+        if name == "category" and text:
+            categories.append(text)
+        elif name in ("enclosure", "content", "thumbnail") and not image:
+            image = child.get("url", "")
+        elif name not in fields:
+            fields[name] = text
+
+    link = fields.get("link", "")
+    key = url_key(link)
+    if not key:
+        return None
+
+    raw_description = fields.get("description", "")
+    if not image:
+        match = _IMG_RE.search(raw_description)
+        image = match.group(1) if match else ""
+
+    title = html.unescape(fields.get("title", ""))
+    platforms = ", ".join(categories)
+    if not platforms:
+        match = _TITLE_PLATFORM_RE.search(title)
+        platforms = match.group(1) if match else ""
+    mask, extra_platforms = platform_mask(platforms)
+
+    return Giveaway(
+        id=_entry_id(fields.get("guid", ""), link, key),
+        title=title,
+        description=html.unescape(_TAG_RE.sub("", raw_description)).strip(),
+        open_giveaway_url=claim_url(link),
+        image=image,
+        thumbnail=image,
+        status="Active",
+        platform_mask=mask,
+        kind=kind,
+        published_ts=_parse_pub_date(fields.get("pubDate", "")),
+        extra_platforms=extra_platforms,
+    )
+
+
+@dataclass
+class FeedState:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    entries: List[Giveaway] = field(default_factory=list)
+
+
+@dataclass
+class FeedStats:
+    fetched: int = 0
+    not_modified: int = 0
+    failed: int = 0
+    entries: int = 0
+
+
+class RssIngestor:
+    def __init__(
+        self,
+        feeds: Iterable[str],
+        *,
+        timeout_seconds: float = 15.0,
+        concurrency: int = 4,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.feeds = list(dict.fromkeys(feeds))
+        self.stats = FeedStats()
+
+        self._client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max(1, concurrency),
+                max_keepalive_connections=max(1, concurrency),
+            ),
+            transport=transport,
+        )
+        self._states: Dict[str, FeedState] = {url: FeedState() for url in self.feeds}
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    @property
+    def entries(self) -> List[Giveaway]:
+        merged: Dict[str, Giveaway] = {}
+
+        for url in self.feeds:
+            for giveaway in self._states[url].entries:
+                key = url_key(giveaway.open_giveaway_url)
+                known = merged.get(key)
+                if known is None or known.kind is GiveawayType.OTHER:
+                    merged[key] = giveaway
+
+        return list(merged.values())
+
+    async def fetch_all(self) -> List[Giveaway]:
+        await asyncio.gather(*(self._fetch_feed(url) for url in self.feeds))
+
+        entries = self.entries
+        self.stats.entries = len(entries)
+        return entries
+
+    async def _fetch_feed(self, url: str) -> None:
+        state = self._states[url]
+        headers: Dict[str, str] = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+        kind = _FEED_KINDS.get(url_key(url).rsplit("/", 1)[-1], GiveawayType.OTHER)
+
+        try:
+            async with self._client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    self.stats.not_modified += 1
+                    return
+
+                response.raise_for_status()
+                entries = await self._parse_stream(response, kind)
+
+                state.etag = response.headers.get("ETag")
+                state.last_modified = response.headers.get("Last-Modified")
+
+        except (httpx.HTTPError, ElementTree.ParseError) as exc:
+            self.stats.failed += 1
+            log.warning("Failed To Fetch RSS Feed %s: %s", url, exc)
+            return
+
+        state.entries = entries
+        self.stats.fetched += 1
+
+    @staticmethod
+    async def _parse_stream(
+        response: httpx.Response, kind: GiveawayType
+    ) -> List[Giveaway]:
+        parser = ElementTree.XMLPullParser(events=("start", "end"))
+        entries: List[Giveaway] = []
+        parents: List[ElementTree.Element] = []
+
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+
+            for event, element in parser.read_events():
+                if event == "start":
+                    parents.append(element)
+                    continue
+
+                parents.pop()
+                if _local(element.tag) != "item":
+                    continue
+
+                giveaway = normalize_item(element, kind)
+                if giveaway is not None:
+                    entries.append(giveaway)
+
+                if parents:
+                    parents[-1].remove(element)
+
+        parser.close()
+        return entries
+
+
+def _with_id(giveaway: Giveaway, giveaway_id: int) -> Giveaway:
+    row = giveaway.to_row()
+    row[0] = giveaway_id
+    return Giveaway.from_row(row)
+
+
+def rss_only(
+    merged: Iterable[Giveaway], api_items: Iterable[Giveaway]
+) -> Dict[int, Giveaway]:
+    api_keys = {url_key(giveaway.open_giveaway_url) for giveaway in api_items}
+    return {
+        giveaway.id: giveaway
+        for giveaway in merged
+        if url_key(giveaway.open_giveaway_url) not in api_keys
+    }
+
+
+def merge_giveaways(
+    api_items: Iterable[Giveaway],
+    rss_items: Iterable[Giveaway],
+    previous: GiveawayCatalog,
+) -> List[Giveaway]:
+    aliases = {
+        url_key(giveaway.open_giveaway_url): giveaway.id
+        for giveaway in previous.by_id.values()
+        if giveaway.id < 0
+    }
+
+    merged: List[Giveaway] = []
+    seen_ids = set()
+    seen_keys = set()
+    newest_ts = 0
+
+    for giveaway in api_items:
+        key = url_key(giveaway.open_giveaway_url)
+        alias = aliases.get(key)
+        if alias is not None:
+            giveaway = _with_id(giveaway, alias)
+
+        merged.append(giveaway)
+        seen_ids.add(giveaway.id)
+        seen_keys.add(key)
+        newest_ts = max(newest_ts, giveaway.published_ts or 0)
+
+    if not newest_ts:
+        return merged
+
+    early: List[Giveaway] = []
+    for giveaway in rss_items:
+        key = url_key(giveaway.open_giveaway_url)
+        if key in seen_keys or giveaway.id in seen_ids:
+            continue
+
+        if key in aliases:
+            giveaway = _with_id(giveaway, aliases[key])
+        elif (
+            giveaway.id not in previous.by_id
+            and (giveaway.published_ts or 0) < newest_ts
+        ):
+            continue
+
+        early.append(giveaway)
+        seen_ids.add(giveaway.id)
+        seen_keys.add(key)
+
+    early.sort(key=lambda giveaway: giveaway.published_ts or 0, reverse=True)
+    return early + merged
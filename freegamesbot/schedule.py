@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import enum
+import random
+from typing import Callable
+
+
+class PollOutcome(enum.Enum):
+    NEW = "New Giveaways Found"
+    CHANGED = "Catalog Changed"
+    UNCHANGED = "No Changes"
+    FAILED = "API Failure"
+
+
+class AdaptivePollSchedule:
+    def __init__(
+        self,
+        base_seconds: float,
+        min_seconds: float,
+        max_seconds: float,
+        *,
+        jitter: float = 0.1,
+        backoff: float = 1.5,
+        rng: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        self.min_seconds = min_seconds
+        self.max_seconds = max(min_seconds, max_seconds)
+        self.jitter = jitter
+        self.backoff = backoff
+        self._rng = rng
+
+        self.interval = self._clamp(base_seconds)
+        self.reason = "Configured Default"
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_seconds, max(self.min_seconds, seconds))
+
+    def restore(self, seconds: float, reason: str) -> None:
+        self.interval = self._clamp(seconds)
+        self.reason = reason
+
+    def advance(self, outcome: PollOutcome) -> float:
+        if outcome is PollOutcome.NEW:
+            self.interval = self._clamp(self.interval / 2)
+        elif outcome is PollOutcome.UNCHANGED:
+            self.interval = self._clamp(self.interval * self.backoff)
+        elif outcome is PollOutcome.FAILED:
+            self.interval = self._clamp(self.interval * 2)
+
+        self.reason = outcome.value
+        return self.next_delay()
+
+    def next_delay(self) -> float:
+        spread = self.interval * self.jitter
+        return self._clamp(self.interval + self._rng(-spread, spread))
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Set
+
+import discord
+
+log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, capacity: int, per_seconds: float) -> None:
+        self.capacity = float(max(1, capacity))
+        self.fill_rate = self.capacity / per_seconds
+
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.fill_rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        self._refill(now)
+        blocked = max(0.0, self.blocked_until - now)
+        if self.tokens >= 1:
+            return blocked
+        return max(blocked, (1 - self.tokens) / self.fill_rate)
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+    def block(self, until: float) -> None:
+        self.blocked_until = max(self.blocked_until, until)
+        self.tokens = 0
+
+
+@dataclass
+class SendStats:
+    enqueued: int = 0
+    sent: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.sent if self.sent else 0.0
+
+
+@dataclass
+class OutboundMessage:
+    channel: discord.abc.Messageable
+    kwargs: Dict[str, Any]
+    future: "asyncio.Future[discord.Message]"
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+
+class SendScheduler:
+    def __init__(
+        self,
+        *,
+        global_rate: int = 45,
+        channel_rate: int = 5,
+        channel_per_seconds: float = 5.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self.channel_rate = channel_rate
+        self.channel_per_seconds = channel_per_seconds
+        self.max_attempts = max_attempts
+        self.stats = SendStats()
+
+        self._global = TokenBucket(global_rate, 1.0)
+        self._buckets: Dict[int, TokenBucket] = {}
+        self._queues: Dict[int, Deque[OutboundMessage]] = {}
+        self._ring: Deque[int] = deque()
+        self._busy: Set[int] = set()
+        self._sending: Set["asyncio.Future[discord.Message]"] = set()
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._deliveries: Set[asyncio.Task[None]] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def submit(
+        self, channel: discord.abc.Messageable, **kwargs: Any
+    ) -> "asyncio.Future[discord.Message]":
+        self.start()
+
+        message = OutboundMessage(
+            channel=channel,
+            kwargs=kwargs,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        channel_id = channel.id
+
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = deque()
+            self._ring.append(channel_id)
+
+        queue.append(message)
+        self.stats.enqueued += 1
+        self._wakeup.set()
+
+        return message.future
+
+    async def send(
+        self, channel: discord.abc.Messageable, **kwargs: Any
+    ) -> discord.Message:
+        return await self.submit(channel, **kwargs)
+
+    def withdraw(self, future: "asyncio.Future[discord.Message]") -> bool:
+        if future in self._sending:
+            return False
+
+        future.cancel()
+        return True
+
+    def _bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._buckets[channel_id] = TokenBucket(
+                self.channel_rate, self.channel_per_seconds
+            )
+        return bucket
+
+    def _next_ready(self, now: float) -> tuple[Optional[OutboundMessage], float]:
+        wait = float("inf")
+
+        for _ in range(len(self._ring)):
+            channel_id = self._ring[0]
+            self._ring.rotate(-1)
+
+            queue = self._queues[channel_id]
+            while queue and queue[0].future.done():
+                queue.popleft()
+
+            if not queue:
+                if channel_id not in self._busy:
+                    self._ring.remove(channel_id)
+                    del self._queues[channel_id]
+                continue
+
+            if channel_id in self._busy:
+                continue
+
+            delay = self._bucket(channel_id).delay(now)
+            if delay <= 0:
+                return queue.popleft(), 0.0
+
+            wait = min(wait, delay)
+
+        return None, wait
+
+    async def _drain(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+
+            global_delay = self._global.delay(now)
+            if global_delay > 0:
+                await asyncio.sleep(global_delay)
+                continue
+
+            message, wait = self._next_ready(now)
+            if message is None:
+                timeout = None if wait == float("inf") else wait
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            channel_id = message.channel.id
+            self._global.take(now)
+            self._bucket(channel_id).take(now)
+            self._busy.add(channel_id)
+            self._sending.add(message.future)
+
+            delivery = asyncio.create_task(self._deliver(message))
+            self._deliveries.add(delivery)
+            delivery.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, message: OutboundMessage) -> None:
+        channel_id = message.channel.id
+        message.attempts += 1
+
+        try:
+            sent = await message.channel.send(**message.kwargs)
+
+        except discord.HTTPException as exc:
+            if exc.status == 429 and message.attempts < self.max_attempts:
+                self.stats.rate_limited += 1
+                retry_after = _retry_after(exc)
+                self._bucket(channel_id).block(time.monotonic() + retry_after)
+                self._requeue(message)
+                log.warning(
+                    "Rate Limited On Channel %s, Retrying In %.1fs",
+                    channel_id,
+                    retry_after,
+                )
+                return
+
+            if exc.status == 429:
+                self.stats.rate_limited += 1
+
+            self.stats.failed += 1
+            if not message.future.done():
+                message.future.set_exception(exc)
+
+        except Exception as exc:
+            self.stats.failed += 1
+            if not message.future.done():
+                message.future.set_exception(exc)
+
+        else:
+            waited = time.monotonic() - message.enqueued_at
+            self.stats.sent += 1
+            self.stats.total_wait += waited
+            self.stats.max_wait = max(self.stats.max_wait, waited)
+
+            if not message.future.done():
+                message.future.set_result(sent)
+
+        finally:
+            self._busy.discard(channel_id)
+            self._sending.discard(message.future)
+            self._wakeup.set()
+
+    def _requeue(self, message: OutboundMessage) -> None:
+        channel_id = message.channel.id
+        queue = self._queues.get(channel_id)
+
+        if queue is None:
+            queue = self._queues[channel_id] = deque()
+            self._ring.append(channel_id)
+
+        queue.appendleft(message)
+
+
+def _retry_after(exc: discord.HTTPException) -> float:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+
+    try:
+        return float(headers.get("Retry-After", 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Dict, Optional
+
+from freegamesbot.embeds import giveaway_embed
+from freegamesbot.gamerpower import Giveaway
+
+
+def date_fields(end: Optional[str], published: Optional[str]) -> Dict[str, str]:
+    giveaway = Giveaway.from_json(
+        {"id": 1, "title": "Example", "end_date": end, "published_date": published}
+    )
+    embed = giveaway_embed(giveaway)
+    return {field.name: field.value for field in embed.fields}
+
+
+def test_parseable_dates_render_as_discord_timestamps() -> None:
+    fields = date_fields("2026-10-20 23:59:00", "2026-10-17 09:00:00")
+    end = dt.datetime(2026, 10, 20, 23, 59, tzinfo=dt.timezone.utc)
+
+    assert fields["Ends In"] == f"<t:{int(end.timestamp())}:R>"
+    assert fields["Started"].startswith("<t:")
+
+
+def test_unparseable_dates_keep_their_original_text() -> None:
+    fields = date_fields("When Supplies Last", "N/A")
+
+    assert fields["Ends In"] == "When Supplies Last"
+    assert fields["Started"] == "Unknown"
+    assert date_fields(None, "")["Ends In"] == "Unknown"
+
+
+def test_unparsed_date_text_survives_a_snapshot_round_trip() -> None:
+    giveaway = Giveaway.from_json({"id": 1, "end_date": "When Supplies Last"})
+    restored = Giveaway.from_row(giveaway.to_row())
+
+    assert restored.end_date == "When Supplies Last"
+    assert restored == giveaway
+
+    legacy = Giveaway.from_row(giveaway.to_row()[:-2])
+    assert legacy.end_date == "N/A"
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from freegamesbot.gamerpower import GamerPowerClient
+
+GIVEAWAYS = [
+    {
+        "id": 101,
+        "title": "Example Game (Steam) Giveaway",
+        "worth": "$19.99",
+        "platforms": "PC, Steam",
+        "type": "Game",
+        "users": 1200,
+        "status": "Active",
+    },
+    {
+        "id": 102,
+        "title": "Example Loot Pack",
+        "worth": "N/A",
+        "platforms": "Epic Games Store",
+        "type": "DLC",
+        "users": 300,
+        "status": "Active",
+    },
+]
+
+
+class Upstream:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.release = asyncio.Event()
+        self.started = asyncio.Event()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.hits += 1
+        self.started.set()
+        await self.release.wait()
+        return httpx.Response(200, json=GIVEAWAYS, headers={"ETag": '"v1"'})
+
+    def client(self) -> GamerPowerClient:
+        return GamerPowerClient(
+            "https://gamerpower.test/api",
+            max_retries=0,
+            transport=httpx.MockTransport(self.handle),
+        )
+
+
+def test_concurrent_fetches_share_one_upstream_request() -> None:
+    async def scenario() -> None:
+        upstream = Upstream()
+        client = upstream.client()
+        try:
+            tasks = [
+                asyncio.create_task(client.fetch_giveaways(sort_by="date"))
+                for _ in range(1000)
+            ]
+            await upstream.started.wait()
+            upstream.release.set()
+            results = await asyncio.gather(*tasks)
+
+            assert upstream.hits == 1
+            assert client.cache.stats.coalesced == 999
+            assert all([g.id for g in result] == [101, 102] for result in results)
+
+            await client.fetch_giveaways(sort_by="date")
+            assert upstream.hits == 1
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_fetch() -> None:
+    async def scenario() -> None:
+        upstream = Upstream()
+        client = upstream.client()
+        try:
+            first = asyncio.create_task(client.fetch_giveaways())
+            await upstream.started.wait()
+            others = [asyncio.create_task(client.fetch_giveaways()) for _ in range(5)]
+            await asyncio.sleep(0)
+
+            first.cancel()
+            others[0].cancel()
+            upstream.release.set()
+
+            results: List[object] = await asyncio.gather(
+                first, *others, return_exceptions=True
+            )
+
+            assert isinstance(results[0], asyncio.CancelledError)
+            assert isinstance(results[1], asyncio.CancelledError)
+            for result in results[2:]:
+                assert isinstance(result, list)
+                assert [giveaway.id for giveaway in result] == [101, 102]
+            assert upstream.hits == 1
+            assert not client._inflight
+
+            assert len(await client.fetch_giveaways()) == 2
+            assert upstream.hits == 1
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_breaker_probe_is_released_on_any_failure() -> None:
+    async def scenario() -> None:
+        mode = {"value": "refuse"}
+        probe_started = asyncio.Event()
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            if mode["value"] == "refuse":
+                raise httpx.ConnectError("refused", request=request)
+            if mode["value"] == "decode":
+                raise httpx.DecodingError("garbled", request=request)
+            if mode["value"] == "hang":
+                probe_started.set()
+                await asyncio.sleep(3600)
+            return httpx.Response(200, json=GIVEAWAYS)
+
+        client = GamerPowerClient(
+            "https://gamerpower.test/api",
+            max_retries=0,
+            breaker_threshold=1,
+            breaker_reset_seconds=0,
+            transport=httpx.MockTransport(handle),
+        )
+        breaker = client.breaker
+        try:
+            with pytest.raises(httpx.ConnectError):
+                await client._request("/giveaways", {}, {})
+            assert breaker.state == breaker.OPEN
+
+            mode["value"] = "decode"
+            with pytest.raises(httpx.DecodingError):
+                await client._request("/giveaways", {}, {})
+            assert breaker.state == breaker.OPEN
+            assert not breaker._probing
+
+            mode["value"] = "hang"
+            probe = asyncio.create_task(client._request("/giveaways", {}, {}))
+            await probe_started.wait()
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            assert breaker.state == breaker.OPEN
+            assert not breaker._probing
+
+            mode["value"] = "ok"
+            response = await client._request("/giveaways", {}, {})
+            assert response.status_code == 200
+            assert breaker.state == breaker.CLOSED
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_fetch_stays_shared_after_its_owner_is_cancelled() -> None:
+    async def scenario() -> None:
+        upstream = Upstream()
+        client = upstream.client()
+        try:
+            owner = asyncio.create_task(client.fetch_giveaways(sort_by="date"))
+            await upstream.started.wait()
+            owner.cancel()
+            await asyncio.gather(owner, return_exceptions=True)
+
+            assert client._inflight
+            late = asyncio.create_task(client.fetch_giveaways(sort_by="date"))
+            await asyncio.sleep(0)
+            upstream.release.set()
+
+            assert [giveaway.id for giveaway in await late] == [101, 102]
+            assert upstream.hits == 1
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
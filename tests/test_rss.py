@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, Dict, List
+
+import httpx
+
+from freegamesbot.catalog import GiveawayCatalog
+from freegamesbot.gamerpower import Giveaway, GiveawayType
+from freegamesbot.rss import RssIngestor, merge_giveaways, rss_only
+
+FEED_URL = "https://www.gamerpower.com/rss/games"
+FEED = (Path(__file__).parent / "fixtures" / "gamerpower_games.xml").read_bytes()
+
+
+def api_giveaway(giveaway_id: int, slug: str, published: str, **extra) -> Giveaway:
+    return Giveaway.from_json(
+        {
+            "id": giveaway_id,
+            "title": slug.replace("-", " ").title(),
+            "open_giveaway_url": f"https://www.gamerpower.com/open/{slug}",
+            "published_date": published,
+            "status": "Active",
+            "type": "Game",
+            **extra,
+        }
+    )
+
+
+LISTED = api_giveaway(2001, "listed-classic-gog-giveaway", "2026-10-16 10:00:00")
+
+
+def fetch_feed(handler) -> List[Giveaway]:
+    async def scenario() -> List[Giveaway]:
+        ingestor = RssIngestor([FEED_URL], transport=httpx.MockTransport(handler))
+        try:
+            return await ingestor.fetch_all()
+        finally:
+            await ingestor.close()
+
+    return asyncio.run(scenario())
+
+
+def test_feed_is_parsed_as_it_streams() -> None:
+    chunks: List[int] = []
+
+    async def body() -> AsyncIterator[bytes]:
+        for start in range(0, len(FEED), 64):
+            chunks.append(start)
+            yield FEED[start : start + 64]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    entries = {giveaway.id: giveaway for giveaway in fetch_feed(handler)}
+
+    assert len(chunks) > 10
+    assert set(entries) >= {3001, 2001, 1500}
+    assert len(entries) == 4
+
+    quest = entries[3001]
+    assert quest.kind is GiveawayType.GAME
+    assert quest.has_platform("pc") and quest.has_platform("steam")
+    assert quest.open_giveaway_url.startswith("https://www.gamerpower.com/open/")
+    assert quest.image == "https://www.gamerpower.com/offers/1/3001.jpg"
+    assert quest.description == "Grab Example Quest for free & keep it forever."
+
+    (mystery,) = [giveaway for giveaway in entries.values() if giveaway.id < 0]
+    assert mystery.image == "https://www.gamerpower.com/offers/1/mystery.jpg"
+
+
+def test_unchanged_feed_is_revalidated_with_304() -> None:
+    requests: List[Dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"feed-v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=FEED,
+            headers={
+                "ETag": '"feed-v1"',
+                "Last-Modified": "Sat, 17 Oct 2026 09:00:00 GMT",
+            },
+        )
+
+    async def scenario() -> None:
+        ingestor = RssIngestor([FEED_URL], transport=httpx.MockTransport(handler))
+        try:
+            first = await ingestor.fetch_all()
+            second = await ingestor.fetch_all()
+        finally:
+            await ingestor.close()
+
+        assert "if-none-match" not in requests[0]
+        assert requests[1]["if-none-match"] == '"feed-v1"'
+        assert requests[1]["if-modified-since"] == "Sat, 17 Oct 2026 09:00:00 GMT"
+        assert [g.id for g in second] == [g.id for g in first]
+        assert ingestor.stats.fetched == 1
+        assert ingestor.stats.not_modified == 1
+
+    asyncio.run(scenario())
+
+
+def test_merge_dedupes_rss_entries_by_slug_and_id() -> None:
+    rss_items = fetch_feed(lambda request: httpx.Response(200, content=FEED))
+    renamed = api_giveaway(3001, "example-quest-renamed", "2026-10-16 11:00:00")
+
+    merged = merge_giveaways([LISTED, renamed], rss_items, GiveawayCatalog())
+    ids = [giveaway.id for giveaway in merged]
+
+    assert len(ids) == len(set(ids))
+    assert 2001 in ids and 3001 in ids
+    assert 1500 not in ids
+    assert [g for g in merged if g.id == 3001][0] is renamed
+
+    (early,) = rss_only(merged, [LISTED, renamed]).values()
+    assert early.id < 0
+    assert merged[0] is early
+
+
+def test_api_listing_keeps_the_rss_id_of_an_early_entry() -> None:
+    rss_items = fetch_feed(lambda request: httpx.Response(200, content=FEED))
+    catalog = GiveawayCatalog()
+    catalog.replace(merge_giveaways([LISTED], rss_items, catalog))
+
+    early = rss_only(catalog.query(), [LISTED])
+    mystery_id = next(gid for gid in early if gid < 0)
+    assert set(early) == {3001, mystery_id}
+
+    confirmed = [
+        LISTED,
+        api_giveaway(
+            3002,
+            "mystery-adventure-epic-games-giveaway",
+            "2026-10-17 08:45:00",
+            worth="$24.99",
+        ),
+    ]
+    merged = merge_giveaways(confirmed, rss_items, catalog)
+    by_id = {giveaway.id: giveaway for giveaway in merged}
+
+    assert 3002 not in by_id
+    assert by_id[mystery_id].worth == "$24.99"
+    assert by_id[mystery_id].content_hash() != catalog.by_id[mystery_id].content_hash()
+    assert set(rss_only(merged, confirmed)) == {3001}
+
+
+def test_rss_entries_are_not_admitted_without_api_results() -> None:
+    rss_items = fetch_feed(lambda request: httpx.Response(200, content=FEED))
+    catalog = GiveawayCatalog()
+    catalog.replace(merge_giveaways([LISTED], rss_items, catalog))
+
+    assert merge_giveaways([], rss_items, GiveawayCatalog()) == []
+    assert merge_giveaways([], rss_items, catalog) == []